@@ -0,0 +1,87 @@
+"""Shared helpers for the benchmark scripts.
+
+Run benchmarks from the repository root so `nutrisync_2` is importable, e.g.
+
+    python -m benchmarks.navigation_latency
+"""
+import math
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEV_DB = REPO_ROOT / "dev.db"
+
+
+@contextmanager
+def database_copy(source=DEV_DB):
+    """Yield the path of a throwaway copy of a SQLite file so dev.db is never touched."""
+    tmpdir = tempfile.mkdtemp(prefix="nutrisync-bench-")
+    path = os.path.join(tmpdir, "bench.db")
+    if source:
+        shutil.copyfile(source, path)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def prisma_client(path, profile=None):
+    """Build a Prisma client pointed at a SQLite file instead of the schema's dev.db.
+
+    With a StorageProfile the URL carries its connection settings too.
+    """
+    from prisma import Prisma
+
+    url = profile.datasource_url(path) if profile else f"file:{path}"
+    return Prisma(datasource={"url": url})
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(name, samples_ms):
+    return {
+        "name": name,
+        "count": len(samples_ms),
+        "mean_ms": statistics.fmean(samples_ms) if samples_ms else 0.0,
+        "p50_ms": percentile(samples_ms, 50),
+        "p95_ms": percentile(samples_ms, 95),
+        "p99_ms": percentile(samples_ms, 99),
+        "max_ms": max(samples_ms) if samples_ms else 0.0,
+    }
+
+
+def print_table(rows):
+    print(f"{'name':<40}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for row in rows:
+        print(
+            f"{row['name']:<40}{row['count']:>8}"
+            f"{row['mean_ms']:>10.2f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+            f"{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}"
+        )
+
+
+class Stopwatch:
+    """Collects elapsed milliseconds for `with stopwatch:` blocks."""
+
+    def __init__(self):
+        self.samples = []
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append((time.perf_counter() - self._start) * 1000)
+        return False
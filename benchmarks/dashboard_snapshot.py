@@ -0,0 +1,41 @@
+"""Dashboard load time: six sequential queries vs. DashboardSnapshot.load.
+
+    python -m benchmarks.dashboard_snapshot --rounds 200
+"""
+import argparse
+import asyncio
+
+from benchmarks.common import Stopwatch, database_copy, print_table, prisma_client, summarize
+from benchmarks.navigation_latency import dashboard as sequential_dashboard
+from nutrisync_2.ConnectionManager import ConnectionManager
+from nutrisync_2.DashboardSnapshot import DashboardSnapshot
+
+
+async def main(rounds):
+    with database_copy() as path:
+        manager = ConnectionManager(prisma_client(path))
+        try:
+            async with manager.connection() as db:
+                user = await db.user.find_first(order={'id': 'asc'})
+                user_id = user.id if user else 0
+
+                sequential, snapshot = Stopwatch(), Stopwatch()
+                for _ in range(rounds):
+                    with sequential:
+                        await sequential_dashboard(db, user_id)
+                    with snapshot:
+                        await DashboardSnapshot.load(db, user_id)
+        finally:
+            await manager.shutdown()
+
+    print_table([
+        summarize("sequential queries", sequential.samples),
+        summarize("DashboardSnapshot.load", snapshot.samples),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
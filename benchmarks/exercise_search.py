@@ -0,0 +1,69 @@
+"""Exercise picker search: substring scan vs. ExerciseSearch at 1k/10k/100k names.
+
+Also times adding one name to a built index, which is what happens when a
+saved workout introduces a new exercise.
+
+    python -m benchmarks.exercise_search --rounds 5
+"""
+import argparse
+import random
+
+from benchmarks.common import Stopwatch, print_table, summarize
+from nutrisync_2.ExerciseSearch import ExerciseSearch
+from nutrisync_2.SyntheticData import EXERCISE_CATALOG
+
+SIZES = (1_000, 10_000, 100_000)
+VARIANTS = ("Seated", "Standing", "Incline", "Decline", "Single-Arm", "Cable",
+            "Smith Machine", "Banded", "Paused", "Wide-Grip", "Close-Grip")
+# Each prefix of these is one keystroke
+QUERIES = ("bench press", "bnch prss", "seated curl", "smith squat", "legs")
+
+
+def synthetic_entries(count, seed=42):
+    """Catalog entries padded with numbered variants of the real exercises."""
+    rng = random.Random(seed)
+    entries = list(EXERCISE_CATALOG)
+    while len(entries) < count:
+        name, category = rng.choice(EXERCISE_CATALOG)
+        entries.append((f"{rng.choice(VARIANTS)} {name} {len(entries)}", category))
+    return entries
+
+
+def substring_scan(names, query, k):
+    """What a plain filter over the whole catalog does on every keystroke."""
+    key = query.casefold()
+    return [name for name in names if key in name.casefold()][:k]
+
+
+def main(rounds):
+    keystrokes = [query[:end] for query in QUERIES for end in range(1, len(query) + 1)]
+    results = []
+    for size in SIZES:
+        entries = synthetic_entries(size)
+        names = sorted(name for name, _ in entries)
+        build, add, scan, search = Stopwatch(), Stopwatch(), Stopwatch(), Stopwatch()
+        for round in range(rounds):
+            with build:
+                index = ExerciseSearch(entries)
+            with add:
+                index.add([(f"Sled Push {round}", "Legs")])
+            for query in keystrokes:
+                with scan:
+                    substring_scan(names, query, 20)
+                with search:
+                    index.top_k(query)
+
+        results += [
+            summarize(f"{size:>7,} build index", build.samples),
+            summarize(f"{size:>7,} add one name", add.samples),
+            summarize(f"{size:>7,} substring scan", scan.samples),
+            summarize(f"{size:>7,} top_k", search.samples),
+        ]
+    print_table(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    main(args.rounds)
@@ -0,0 +1,151 @@
+"""Headless load test: N simulated users driving the real pages against a SQLite copy.
+
+Each simulated user runs its own GymTrackerApp on a stub Flet page, so
+login, navigation, page mounts/refreshes and WorkoutLogger.save_workout
+all run the application code, just without a Flet client. All sessions
+share the process-wide ConnectionManager, as they would in web mode.
+
+    python -m benchmarks.load_test --users 50 --rounds 5 --max-queries 8
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import sqlite3
+import time
+from collections import Counter
+
+import bcrypt
+
+from benchmarks.common import Stopwatch, database_copy, print_table, prisma_client, summarize
+from benchmarks.sqlite_fixtures import build_database
+from nutrisync_2.ConnectionManager import ConnectionManager
+from nutrisync_2.GymTrackerApp import GymTrackerApp
+from nutrisync_2.SyntheticData import EXERCISE_CATALOG
+
+PASSWORD = "load-test"
+ROUTES = ["/", "/log-workout", "/history", "/progress", "/profile"]
+
+
+class StubPage:
+    """The parts of ft.Page the app touches, with no client behind them."""
+
+    def __init__(self):
+        self.title = None
+        self.theme_mode = None
+        self.padding = None
+        self.on_close = None
+        self.overlay = []
+        self.controls = []
+        self.snack_bars = []
+
+    def add(self, *controls):
+        self.controls.extend(controls)
+
+    def update(self, *controls):
+        pass
+
+    async def update_async(self, *controls):
+        pass
+
+    def show_snack_bar(self, snack_bar):
+        self.snack_bars.append(snack_bar.content.value)
+
+
+class LoadStats:
+    def __init__(self):
+        self.timings = {}
+        self.errors = Counter()
+
+    async def timed(self, name, coro):
+        stopwatch = self.timings.setdefault(name, Stopwatch())
+        try:
+            with stopwatch:
+                await coro
+        except Exception as e:
+            self.record_error(str(e))
+
+    def record_error(self, message):
+        lowered = message.lower()
+        if "locked" in lowered or "busy" in lowered:
+            self.errors["sqlite busy/locked"] += 1
+        else:
+            self.errors["other"] += 1
+
+
+def prepare_database(path, users, workouts_per_user):
+    """Seeded schema at the current migration, every user sharing PASSWORD."""
+    build_database(path, users, workouts_per_user)
+    conn = sqlite3.connect(path)
+
+    hashed = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    conn.execute('UPDATE "User" SET "password" = ?', (hashed,))
+    conn.commit()
+    conn.close()
+
+
+async def log_workout(app, rng, stats):
+    logger = app.pages["/log-workout"]
+    for _ in range(3):
+        logger.exercise_dropdown.value = rng.choice(EXERCISE_CATALOG)[0]
+        logger.sets_input.value = str(rng.randint(2, 5))
+        logger.reps_input.value = str(rng.randint(5, 12))
+        logger.weight_input.value = str(rng.randint(10, 150))
+        logger.add_exercise(None)
+    logger.workout_type_dropdown.value = "Strength"
+
+    failures = len(app.page.snack_bars)
+    await stats.timed("save workout", logger.save_workout(None))
+    # save_workout reports its own failures through a snack bar
+    for message in app.page.snack_bars[failures:]:
+        if message.startswith("Workout was not saved"):
+            stats.record_error(message)
+
+
+async def simulate_user(user_id, rounds, stats):
+    rng = random.Random(user_id)
+    app = GymTrackerApp()
+    await app.initialize(StubPage())
+    try:
+        for _ in range(rounds):
+            await stats.timed("login", app.login(f"user{user_id}@example.com", PASSWORD))
+            if not app.is_authenticated:
+                stats.record_error("login failed")
+                continue
+            for route in ROUTES:
+                await stats.timed(route, app.navigate(route))
+                if route == "/log-workout":
+                    await log_workout(app, rng, stats)
+            await stats.timed("logout", app.logout())
+    finally:
+        await app.shutdown()
+
+
+async def main(users, rounds, workouts_per_user, max_queries):
+    with database_copy(source=None) as path:
+        prepare_database(path, users, workouts_per_user)
+        ConnectionManager._shared = ConnectionManager(prisma_client(path), max_concurrent_queries=max_queries)
+
+        stats = LoadStats()
+        started = time.perf_counter()
+        # Every session prints its startup report; keep the results readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            await asyncio.gather(*(simulate_user(u, rounds, stats) for u in range(1, users + 1)))
+        elapsed = time.perf_counter() - started
+
+    operations = sum(len(stopwatch.samples) for stopwatch in stats.timings.values())
+    print(f"{users} users x {rounds} rounds, max {max_queries} concurrent queries")
+    print(f"{operations} operations in {elapsed:.1f} s = {operations / elapsed:.1f} ops/s")
+    print_table([summarize(name, stopwatch.samples) for name, stopwatch in stats.timings.items()])
+    print("errors:", dict(stats.errors) or "none")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--workouts-per-user", type=int, default=50)
+    parser.add_argument("--max-queries", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.rounds, args.workouts_per_user, args.max_queries))
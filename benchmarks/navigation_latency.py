@@ -0,0 +1,109 @@
+"""Navigation latency with connect/disconnect per page vs. the shared ConnectionManager.
+
+Replays the read queries each page runs in `before_build` against a copy of
+dev.db. The "per-page" mode reproduces the old behaviour of starting and
+stopping the query engine around every page load; "shared" borrows the
+engine from one long-lived ConnectionManager.
+
+    python -m benchmarks.navigation_latency --rounds 20
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+import pytz
+
+from benchmarks.common import Stopwatch, database_copy, print_table, prisma_client, summarize
+from nutrisync_2.ConnectionManager import ConnectionManager
+
+
+async def dashboard(db, user_id):
+    week_start = datetime.now(pytz.utc) - timedelta(days=datetime.now(pytz.utc).weekday())
+    await db.workout.count(where={'userId': user_id})
+    await db.streak.find_first(where={'userId': user_id}, order={'endDate': 'desc'})
+    await db.workout.count(where={'userId': user_id, 'date': {'gte': week_start}})
+    await db.workout.find_many(where={'userId': user_id}, order={'date': 'desc'}, take=5)
+    await db.achievement.find_many(where={'userId': user_id}, order={'dateEarned': 'desc'}, take=3)
+    await db.motivationalquote.find_first(order=[{'dateDisplayed': 'asc'}])
+
+
+async def history(db, user_id):
+    await db.workout.find_many(
+        where={'userId': user_id}, order={'date': 'desc'}, include={'exercises': True}
+    )
+
+
+async def progress(db, user_id):
+    thirty_days_ago = datetime.now(pytz.utc) - timedelta(days=30)
+    await db.workout.find_many(
+        where={'userId': user_id, 'date': {'gte': thirty_days_ago}},
+        include={'exercises': True},
+        order={'date': 'asc'},
+    )
+
+
+async def profile(db, user_id):
+    await db.user.find_unique(where={'id': user_id})
+    await db.weighthistory.find_many(where={'userId': user_id}, order={'date': 'desc'}, take=5)
+
+
+async def log_workout(db, user_id):
+    await db.exerciseoption.find_many(order={'name': 'asc'})
+
+
+ROUTES = {
+    "/": dashboard,
+    "/history": history,
+    "/progress": progress,
+    "/profile": profile,
+    "/log-workout": log_workout,
+}
+
+
+async def run_per_page(path, user_id, rounds):
+    db = prisma_client(path)
+    stopwatch = Stopwatch()
+    for _ in range(rounds):
+        for load in ROUTES.values():
+            with stopwatch:
+                if not db.is_connected():
+                    await db.connect()
+                await load(db, user_id)
+                await db.disconnect()
+    return stopwatch.samples
+
+
+async def run_shared(path, user_id, rounds):
+    manager = ConnectionManager(prisma_client(path))
+    stopwatch = Stopwatch()
+    try:
+        for _ in range(rounds):
+            for load in ROUTES.values():
+                with stopwatch:
+                    async with manager.connection() as db:
+                        await load(db, user_id)
+    finally:
+        await manager.shutdown()
+    return stopwatch.samples
+
+
+async def main(rounds):
+    with database_copy() as path:
+        manager = ConnectionManager(prisma_client(path))
+        async with manager.connection() as db:
+            user = await db.user.find_first(order={'id': 'asc'})
+        await manager.shutdown()
+        user_id = user.id if user else 0
+
+        rows = [
+            summarize("per-page connect/disconnect", await run_per_page(path, user_id, rounds)),
+            summarize("shared ConnectionManager", await run_shared(path, user_id, rounds)),
+        ]
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10, help="visits per route")
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
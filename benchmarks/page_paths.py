@@ -0,0 +1,181 @@
+"""Per-page data paths timed on small/medium/large seeded databases, with baseline comparison.
+
+Times the code each page runs to load its data, using the real page and
+system classes on a stub Flet page:
+
+    Dashboard.load_dashboard_data
+    History.load_workouts
+    ProgressTracking.load_workouts + process_workout_data
+    AchievementSystem.check_achievements
+    GoalSystem.check_and_update_goals
+
+The two write paths run in a transaction that is rolled back after each
+round, so rounds and runs time the same workload.
+
+Results are written as JSON; pass a previous run as --baseline to see
+which paths got slower.
+
+    python -m benchmarks.page_paths --sizes small medium --output results.json
+    python -m benchmarks.page_paths --baseline results.json --output new.json
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+from datetime import datetime
+
+import pytz
+
+from benchmarks.common import REPO_ROOT, Stopwatch, database_copy, print_table, prisma_client, summarize
+from benchmarks.load_test import StubPage
+from benchmarks.sqlite_fixtures import build_database
+from nutrisync_2.AchievementSystem import AchievementSystem
+from nutrisync_2.ConnectionManager import ConnectionManager
+from nutrisync_2.GoalSystem import GoalSystem
+from nutrisync_2.GymTrackerApp import GymTrackerApp
+
+# name: (users, workouts per user); three exercises per workout gives ~1k / 100k / 1M exercises
+SIZES = {
+    "small": (10, 34),
+    "medium": (100, 334),
+    "large": (1000, 334),
+}
+
+
+async def time_paths(app, rounds):
+    user_id = app.current_user_id
+    dashboard = app.pages["/"]
+    history = app.pages["/history"]
+    progress = app.pages["/progress"]
+
+    async with app.db_manager.connection() as db:
+        workout = await db.workout.find_first(
+            where={'userId': user_id}, order={'date': 'desc'}, include={'exercises': True}
+        )
+
+    async def progress_path():
+        await progress.load_workouts()
+        progress.process_workout_data()
+
+    async def rolled_back(write):
+        # Writing paths run in a transaction that is rolled back, so every
+        # round (and every run) starts from the same rows
+        async with app.db_manager.connection() as db:
+            transaction = db.tx()
+            tx = await transaction.start()
+            try:
+                await write(tx)
+            finally:
+                await transaction.rollback()
+
+    async def achievements_path():
+        # Titles awarded in a rolled-back round must not stay cached
+        AchievementSystem.forget(user_id)
+        await rolled_back(lambda tx: AchievementSystem(tx, user_id).check_achievements())
+
+    async def goals_path():
+        await rolled_back(lambda tx: GoalSystem(tx, user_id).check_and_update_goals(workout))
+
+    paths = {
+        "Dashboard.load_dashboard_data": dashboard.load_dashboard_data,
+        "History.load_workouts": history.load_workouts,
+        "ProgressTracking load + process": progress_path,
+        "AchievementSystem.check_achievements": achievements_path,
+        "GoalSystem.check_and_update_goals": goals_path,
+    }
+
+    results = {}
+    for name, path in paths.items():
+        stopwatch = Stopwatch()
+        for _ in range(rounds):
+            with stopwatch:
+                await path()
+        results[name] = summarize(name, stopwatch.samples)
+    return results
+
+
+async def run_size(size, rounds):
+    users, workouts_per_user = SIZES[size]
+    with database_copy(source=None) as path:
+        build_database(path, users, workouts_per_user)
+        ConnectionManager._shared = ConnectionManager(prisma_client(path))
+
+        app = GymTrackerApp()
+        app.page = StubPage()
+        app.db_manager.open_session()
+        app.is_authenticated = True
+        app.current_user_id = 1
+        try:
+            return await time_paths(app, rounds)
+        finally:
+            await app.shutdown()
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Print p50/p95 change per path against a baseline run; returns the regressed paths."""
+    regressions = []
+    print(f"\nAgainst baseline {baseline.get('revision')} ({baseline.get('created')}):")
+    print(f"{'size':<8}{'path':<40}{'p50 ms':>10}{'change':>9}{'p95 ms':>10}{'change':>9}")
+    for size, paths in results.items():
+        for name, row in paths.items():
+            base = baseline.get("results", {}).get(size, {}).get(name)
+            if base is None:
+                continue
+            changes = [
+                (row[key] - base[key]) / base[key] * 100 if base[key] else 0.0
+                for key in ("p50_ms", "p95_ms")
+            ]
+            flag = "  <-- slower" if max(changes) > threshold else ""
+            print(
+                f"{size:<8}{name:<40}{row['p50_ms']:>10.2f}{changes[0]:>+8.1f}%"
+                f"{row['p95_ms']:>10.2f}{changes[1]:>+8.1f}%{flag}"
+            )
+            if flag:
+                regressions.append((size, name))
+    return regressions
+
+
+async def main(args):
+    results = {}
+    for size in args.sizes:
+        results[size] = await run_size(size, args.rounds)
+        print(f"\n{size}: {SIZES[size][0]} users x {SIZES[size][1]} workouts")
+        print_table(list(results[size].values()))
+
+    report = {
+        "revision": git_revision(),
+        "created": datetime.now(pytz.utc).isoformat(),
+        "rounds": args.rounds,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} path(s) slower than baseline by more than {args.threshold}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown flagged as a regression")
+    args = parser.parse_args()
+    asyncio.run(main(args))
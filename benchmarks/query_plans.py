@@ -0,0 +1,123 @@
+"""Query plans and timings for each page's before_build queries, before and after
+the hot-query index migration.
+
+Seeds a synthetic database (100k workouts across 1k users by default),
+runs the SQL that Prisma issues for every page load with and without the
+indexes from migrations/20261018000000_hot_query_indexes, and prints the
+SQLite query plan for each statement.
+
+    python -m benchmarks.query_plans --users 1000 --workouts-per-user 100
+"""
+import argparse
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+from benchmarks.common import database_copy, percentile
+from benchmarks.sqlite_fixtures import apply_migration, create_schema, seed
+from nutrisync_2.DateUtils import to_epoch_ms
+
+INDEX_MIGRATION = "20261018000000_hot_query_indexes"
+
+# (page, label, sql, params builder); `?` params are filled per user
+PAGE_QUERIES = [
+    ("Dashboard", "workout count",
+     'SELECT COUNT(*) FROM "Workout" WHERE "userId" = ?',
+     lambda user_id, now: (user_id,)),
+    ("Dashboard", "latest streak",
+     'SELECT * FROM "Streak" WHERE "userId" = ? ORDER BY "endDate" DESC LIMIT 1',
+     lambda user_id, now: (user_id,)),
+    ("Dashboard", "weekly count",
+     'SELECT COUNT(*) FROM "Workout" WHERE "userId" = ? AND "date" >= ?',
+     lambda user_id, now: (user_id, to_epoch_ms(now - timedelta(days=now.weekday())))),
+    ("Dashboard", "recent workouts",
+     'SELECT * FROM "Workout" WHERE "userId" = ? ORDER BY "date" DESC LIMIT 5',
+     lambda user_id, now: (user_id,)),
+    ("Dashboard", "recent achievements",
+     'SELECT * FROM "Achievement" WHERE "userId" = ? ORDER BY "dateEarned" DESC LIMIT 3',
+     lambda user_id, now: (user_id,)),
+    ("History", "all workouts",
+     'SELECT * FROM "Workout" WHERE "userId" = ? ORDER BY "date" DESC',
+     lambda user_id, now: (user_id,)),
+    ("History", "exercises for workouts",
+     'SELECT * FROM "Exercise" WHERE "workoutId" IN '
+     '(SELECT "id" FROM "Workout" WHERE "userId" = ?)',
+     lambda user_id, now: (user_id,)),
+    ("ProgressTracking", "last 30 days",
+     'SELECT * FROM "Workout" WHERE "userId" = ? AND "date" >= ? ORDER BY "date" ASC',
+     lambda user_id, now: (user_id, to_epoch_ms(now - timedelta(days=30)))),
+    ("ProgressTracking", "exercises for range",
+     'SELECT * FROM "Exercise" WHERE "workoutId" IN '
+     '(SELECT "id" FROM "Workout" WHERE "userId" = ? AND "date" >= ?)',
+     lambda user_id, now: (user_id, to_epoch_ms(now - timedelta(days=30)))),
+    ("Profile", "weight history",
+     'SELECT * FROM "WeightHistory" WHERE "userId" = ? ORDER BY "date" DESC LIMIT 5',
+     lambda user_id, now: (user_id,)),
+    ("GoalTracker", "goals by target date",
+     'SELECT * FROM "Goal" WHERE "userId" = ? ORDER BY "targetDate" ASC',
+     lambda user_id, now: (user_id,)),
+    ("GoalSystem", "active goals",
+     'SELECT * FROM "Goal" WHERE "userId" = ? AND "completed" = 0',
+     lambda user_id, now: (user_id,)),
+    ("AchievementSystem", "earned title lookup",
+     'SELECT * FROM "Achievement" WHERE "userId" = ? AND "title" = \'Week Warrior\' LIMIT 1',
+     lambda user_id, now: (user_id,)),
+]
+
+
+def time_queries(conn, users, samples):
+    now = datetime.now(pytz.utc)
+    results = {}
+    for page, label, sql, params in PAGE_QUERIES:
+        timings = []
+        for i in range(samples):
+            user_id = (i * 7919) % users + 1
+            start = time.perf_counter()
+            conn.execute(sql, params(user_id, now)).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params(1, now)).fetchall()
+        results[(page, label)] = (timings, [row[-1] for row in plan])
+    return results
+
+
+def main(users, workouts_per_user, samples):
+    with database_copy(source=None) as path:
+        conn = sqlite3.connect(path)
+        create_schema(conn)
+        start = time.perf_counter()
+        workouts = seed(conn, users=users, workouts_per_user=workouts_per_user)
+        print(f"Seeded {workouts} workouts across {users} users in {time.perf_counter() - start:.1f}s")
+        conn.execute("ANALYZE")
+
+        before = time_queries(conn, users, samples)
+        apply_migration(conn, INDEX_MIGRATION)
+        conn.execute("ANALYZE")
+        after = time_queries(conn, users, samples)
+        conn.close()
+
+    print(f"\n{'page':<18}{'query':<26}{'before p50':>12}{'p95':>10}{'after p50':>12}{'p95':>10}")
+    for page, label, _, _ in PAGE_QUERIES:
+        old, _ = before[(page, label)]
+        new, plan = after[(page, label)]
+        print(
+            f"{page:<18}{label:<26}"
+            f"{percentile(old, 50):>12.3f}{percentile(old, 95):>10.3f}"
+            f"{percentile(new, 50):>12.3f}{percentile(new, 95):>10.3f}"
+        )
+
+    print("\nQuery plans (before -> after):")
+    for page, label, _, _ in PAGE_QUERIES:
+        print(f"  {page} / {label}")
+        print(f"    before: {'; '.join(before[(page, label)][1])}")
+        print(f"    after:  {'; '.join(after[(page, label)][1])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--workouts-per-user", type=int, default=100)
+    parser.add_argument("--samples", type=int, default=50, help="timed runs per query")
+    args = parser.parse_args()
+    main(args.users, args.workouts_per_user, args.samples)
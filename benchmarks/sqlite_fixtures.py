@@ -0,0 +1,72 @@
+"""Build large synthetic SQLite databases from the migrations in this repo.
+
+These go straight through `sqlite3` so a 100k-workout database can be
+built in seconds without the Prisma query engine.
+"""
+import sqlite3
+from datetime import datetime
+
+import pytz
+
+from benchmarks.common import REPO_ROOT
+from nutrisync_2.DateUtils import to_epoch_ms
+from nutrisync_2.SyntheticData import COLUMNS, EXERCISE_CATALOG, SyntheticData
+
+MIGRATIONS_DIR = REPO_ROOT / "migrations"
+BASELINE_MIGRATION = "0_init"
+
+
+def create_schema(conn):
+    """Create the tables as they were before the repo's migrations (the baseline)."""
+    apply_migration(conn, BASELINE_MIGRATION)
+
+
+def apply_migration(conn, name):
+    conn.executescript((MIGRATIONS_DIR / name / "migration.sql").read_text())
+    conn.commit()
+
+
+def apply_all_migrations(conn):
+    """Apply every migration after the baseline, oldest first."""
+    migrations = sorted(p.name for p in MIGRATIONS_DIR.iterdir() if p.is_dir())
+    for migration in migrations:
+        if migration != BASELINE_MIGRATION:
+            apply_migration(conn, migration)
+
+
+def build_database(path, users, workouts_per_user):
+    """Create a seeded database at `path` with the schema at the latest migration.
+
+    Seeding happens before the migrations so their backfills (UserStats,
+    DailyRollup) cover the seeded rows.
+    """
+    conn = sqlite3.connect(path)
+    create_schema(conn)
+    seed(conn, users=users, workouts_per_user=workouts_per_user)
+    apply_all_migrations(conn)
+    conn.close()
+
+
+def seed(conn, users=1000, workouts_per_user=100, exercises_per_workout=3, days=730, seed=42):
+    """Insert the exercise catalog and SyntheticData users with workouts, exercises, streaks, goals, achievements and weights.
+
+    Workouts are spread over the last `days` days. Returns the number of
+    workouts inserted.
+    """
+    now = to_epoch_ms(datetime.now(pytz.utc))
+    insert_rows(
+        conn, "ExerciseOption", ("name", "category", "createdAt", "updatedAt"),
+        [(name, category, now, now) for name, category in EXERCISE_CATALOG],
+    )
+    data = SyntheticData(seed=seed, days=days)
+    tables = data.tables(users, workouts_per_user, exercises_per_workout)
+    for table, rows in tables.items():
+        insert_rows(conn, table, COLUMNS[table], rows)
+    conn.commit()
+    return len(tables["Workout"])
+
+
+def insert_rows(conn, table, columns, rows):
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    placeholders = ", ".join("?" * len(columns))
+    conn.executemany(f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders})', rows)
@@ -0,0 +1,117 @@
+"""Write throughput and read latency under concurrent sessions for each SQLite storage profile.
+
+Runs the load test's simulated users (login, every page, one saved
+workout per round) against a fresh copy of the same seeded database for
+each profile in nutrisync_2.StorageProfile.PROFILES, then reports saved
+workouts per second, save and page-load latency, lock errors and the
+pragma values SQLite reported for that run.
+
+Each profile runs once per pool size in --pools (0 keeps the engine's
+default pool). "busy read" is the latency of page loads that started
+while another session's save_workout transaction was open; with a single
+connection those reads queue behind the save.
+
+    python -m benchmarks.storage_profiles --users 30 --rounds 3
+    python -m benchmarks.storage_profiles --profiles default wal --pools 1 0
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from benchmarks.common import database_copy, percentile, prisma_client
+from benchmarks.load_test import ROUTES, LoadStats, prepare_database, simulate_user
+from nutrisync_2.ConnectionManager import ConnectionManager
+from nutrisync_2.StorageProfile import PROFILES, StorageProfile
+
+
+class OverlapStats(LoadStats):
+    """LoadStats that also keeps the page loads started while a save was running."""
+
+    def __init__(self):
+        super().__init__()
+        self.saving = 0
+        self.busy_reads = []
+
+    async def timed(self, name, coro):
+        if name == "save workout":
+            self.saving += 1
+            try:
+                await super().timed(name, coro)
+            finally:
+                self.saving -= 1
+        elif name in ROUTES and self.saving:
+            started = time.perf_counter()
+            await super().timed(name, coro)
+            self.busy_reads.append((time.perf_counter() - started) * 1000)
+        else:
+            await super().timed(name, coro)
+
+
+async def run_profile(name, pool, template, users, rounds, max_queries):
+    profile = StorageProfile.named(name)
+    if pool:
+        profile = StorageProfile(name, dict(profile.settings, connection_limit=pool))
+    # A fresh copy each time: WAL mode is stored in the file and would carry over
+    with database_copy(source=template) as path:
+        ConnectionManager._shared = ConnectionManager(
+            prisma_client(path, profile), max_concurrent_queries=max_queries, storage_profile=profile
+        )
+        stats = OverlapStats()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            await asyncio.gather(*(simulate_user(u, rounds, stats) for u in range(1, users + 1)))
+        elapsed = time.perf_counter() - started
+
+    saves = stats.timings["save workout"].samples if "save workout" in stats.timings else []
+    reads = [sample for route in ROUTES if route in stats.timings for sample in stats.timings[route].samples]
+    return {
+        "profile": name,
+        "pool": pool or "default",
+        "saves_per_s": len(saves) / elapsed,
+        "save_p50_ms": percentile(saves, 50),
+        "save_p95_ms": percentile(saves, 95),
+        "read_p50_ms": percentile(reads, 50),
+        "read_p95_ms": percentile(reads, 95),
+        "busy_read_p95_ms": percentile(stats.busy_reads, 95),
+        "errors": sum(stats.errors.values()),
+        "applied": profile.applied,
+    }
+
+
+async def main(args):
+    with database_copy(source=None) as template:
+        prepare_database(template, args.users, args.workouts_per_user)
+        rows = [
+            await run_profile(name, pool, template, args.users, args.rounds, args.max_queries)
+            for name in args.profiles
+            for pool in args.pools
+        ]
+
+    print(f"{args.users} concurrent sessions x {args.rounds} rounds, max {args.max_queries} concurrent queries")
+    print(
+        f"{'profile':<14}{'pool':>8}{'saves/s':>10}{'save p50':>10}{'save p95':>10}"
+        f"{'read p50':>10}{'read p95':>10}{'busy read p95':>15}{'errors':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['profile']:<14}{row['pool']:>8}{row['saves_per_s']:>10.1f}{row['save_p50_ms']:>10.2f}"
+            f"{row['save_p95_ms']:>10.2f}{row['read_p50_ms']:>10.2f}{row['read_p95_ms']:>10.2f}"
+            f"{row['busy_read_p95_ms']:>15.2f}{row['errors']:>8}"
+        )
+    print("\nSettings reported by SQLite:")
+    for row in rows:
+        print(f"{row['profile']:<14}{row['pool']:>8}  " + ", ".join(f"{key}={value}" for key, value in row["applied"].items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument("--pools", nargs="+", type=int, default=[1, 0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--workouts-per-user", type=int, default=50)
+    parser.add_argument("--max-queries", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -1,53 +1,85 @@
 from prisma import Prisma
+import argparse
 import asyncio
+from datetime import timedelta
 
-async def clean_database():
+# Every table that holds user data, children before parents so no delete
+# trips a foreign key. The SQL selects one user's rows for --user-id.
+USER_TABLES = [
+    ("Exercise", '"workoutId" IN (SELECT "id" FROM "Workout" WHERE "userId" = ?)'),
+    ("PlanExercise", '"workoutPlanId" IN (SELECT "id" FROM "WorkoutPlan" WHERE "userId" = ?)'),
+    ("Workout", '"userId" = ?'),
+    ("WorkoutPlan", '"userId" = ?'),
+    ("Achievement", '"userId" = ?'),
+    ("Goal", '"userId" = ?'),
+    ("Streak", '"userId" = ?'),
+    ("WeightHistory", '"userId" = ?'),
+    ("UserStats", '"userId" = ?'),
+    ("DailyRollup", '"userId" = ?'),
+    ("User", '"id" = ?'),
+]
+
+# Shared reference data, only removed by a full reset
+CATALOG_TABLES = ["ExerciseOption", "MotivationalQuote"]
+
+async def reset_all(db, keep_catalog):
+    tables = [table for table, _ in USER_TABLES]
+    if not keep_catalog:
+        tables += CATALOG_TABLES
+
+    for table in tables:
+        # Without a WHERE clause SQLite can truncate a table instead of deleting row by row
+        count = await db.execute_raw(f'DELETE FROM "{table}"')
+        print(f"Deleted {count} {table} rows")
+
+    # Start ids from 1 again so a reseeded database gets the same ids
+    await db.execute_raw(
+        f'DELETE FROM "sqlite_sequence" WHERE "name" IN ({", ".join(["?"] * len(tables))})', *tables
+    )
+
+async def purge_user(db, user_id):
+    user = await db.user.find_unique(where={'id': user_id})
+    if user is None:
+        raise ValueError(f"No user with id {user_id}")
+
+    print(f"Purging user {user_id} ({user.email})...")
+    for table, where in USER_TABLES:
+        count = await db.execute_raw(f'DELETE FROM "{table}" WHERE {where}', user_id)
+        print(f"Deleted {count} {table} rows")
+
+async def clean_database(args):
     print("Starting database cleanup...")
     db = Prisma()
     await db.connect()
 
     try:
-        # Delete records from all tables in the correct order to respect foreign key constraints
-        
-        # First, delete dependent tables
-        print("Deleting exercises...")
-        await db.exercise.delete_many()
-        
-        print("Deleting plan exercises...")
-        await db.planexercise.delete_many()
-        
-        print("Deleting achievements...")
-        await db.achievement.delete_many()
-        
-        print("Deleting goals...")
-        await db.goal.delete_many()
-        
-        print("Deleting streaks...")
-        await db.streak.delete_many()
-        
-        print("Deleting exercise options...")
-        await db.exerciseoption.delete_many()
-        
-        print("Deleting motivational quotes...")
-        await db.motivationalquote.delete_many()
-        
-        print("Deleting workouts...")
-        await db.workout.delete_many()
-        
-        print("Deleting workout plans...")
-        await db.workoutplan.delete_many()
-        
-        # Finally, delete users
-        print("Deleting users...")
-        await db.user.delete_many()
-        
+        # One transaction: the database is either fully cleaned or untouched
+        async with db.tx(timeout=timedelta(minutes=10)) as tx:
+            if args.user_id is not None:
+                await purge_user(tx, args.user_id)
+            else:
+                await reset_all(tx, args.keep_catalog)
+
+        # Both have to run outside a transaction. VACUUM gives the freed
+        # pages back to the filesystem; ANALYZE refreshes the planner's
+        # statistics for the smaller tables.
+        print("Compacting database file...")
+        await db.execute_raw("VACUUM")
+        await db.execute_raw("ANALYZE")
+
         print("Database cleanup completed successfully!")
-        
+
     except Exception as e:
         print(f"Error during database cleanup: {str(e)}")
-        
+
     finally:
         await db.disconnect()
 
 if __name__ == "__main__":
-    asyncio.run(clean_database())
+    parser = argparse.ArgumentParser(description="Delete all data, or everything belonging to one user.")
+    parser.add_argument("--user-id", type=int, help="purge only this user and all of their records")
+    parser.add_argument(
+        "--keep-catalog", action="store_true",
+        help="on a full reset, keep exercise options and motivational quotes",
+    )
+    asyncio.run(clean_database(parser.parse_args()))
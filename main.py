@@ -1,9 +1,12 @@
+from nutrisync_2.StartupTimer import StartupTimer
+startup_timer = StartupTimer()
+
 import flet as ft
-from nutrisync_2.Page import Page
 from nutrisync_2.GymTrackerApp import GymTrackerApp
+startup_timer.mark("imports")
 
 async def main(page: ft.Page):
-    app = GymTrackerApp()
+    app = GymTrackerApp(startup_timer.session())
     await app.initialize(page)
 
 ft.app(main)
@@ -0,0 +1,20 @@
+-- CreateIndex
+CREATE INDEX "WeightHistory_userId_date_idx" ON "WeightHistory"("userId", "date");
+
+-- CreateIndex
+CREATE INDEX "Workout_userId_date_idx" ON "Workout"("userId", "date");
+
+-- CreateIndex
+CREATE INDEX "Exercise_workoutId_idx" ON "Exercise"("workoutId");
+
+-- CreateIndex
+CREATE INDEX "Streak_userId_endDate_idx" ON "Streak"("userId", "endDate");
+
+-- CreateIndex
+CREATE INDEX "Goal_userId_completed_idx" ON "Goal"("userId", "completed");
+
+-- CreateIndex
+CREATE INDEX "Achievement_userId_dateEarned_idx" ON "Achievement"("userId", "dateEarned");
+
+-- CreateIndex
+CREATE INDEX "Achievement_userId_title_idx" ON "Achievement"("userId", "title");
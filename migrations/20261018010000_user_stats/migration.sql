@@ -0,0 +1,34 @@
+-- CreateTable
+CREATE TABLE "UserStats" (
+    "userId" INTEGER NOT NULL PRIMARY KEY,
+    "totalWorkouts" INTEGER NOT NULL DEFAULT 0,
+    "totalMinutes" INTEGER NOT NULL DEFAULT 0,
+    "distinctExercises" INTEGER NOT NULL DEFAULT 0,
+    "longestDuration" INTEGER NOT NULL DEFAULT 0,
+    "currentStreak" INTEGER NOT NULL DEFAULT 0,
+    "longestStreak" INTEGER NOT NULL DEFAULT 0,
+    "lastWorkoutDate" DATETIME,
+    "latestWeight" REAL,
+    "updatedAt" DATETIME NOT NULL,
+    CONSTRAINT "UserStats_userId_fkey" FOREIGN KEY ("userId") REFERENCES "User" ("id") ON DELETE RESTRICT ON UPDATE CASCADE
+);
+
+-- Backfill existing users (same as rebuild-stats.py)
+INSERT INTO "UserStats" (
+    "userId", "totalWorkouts", "totalMinutes", "distinctExercises", "longestDuration",
+    "currentStreak", "longestStreak", "lastWorkoutDate", "latestWeight", "updatedAt"
+)
+SELECT
+    u."id",
+    (SELECT COUNT(*) FROM "Workout" w WHERE w."userId" = u."id"),
+    (SELECT COALESCE(SUM(w."duration"), 0) FROM "Workout" w WHERE w."userId" = u."id"),
+    (SELECT COUNT(DISTINCT e."name") FROM "Exercise" e
+        JOIN "Workout" w ON w."id" = e."workoutId" WHERE w."userId" = u."id"),
+    (SELECT COALESCE(MAX(w."duration"), 0) FROM "Workout" w WHERE w."userId" = u."id"),
+    COALESCE((SELECT s."currentStreak" FROM "Streak" s WHERE s."userId" = u."id"
+        ORDER BY s."endDate" DESC LIMIT 1), 0),
+    COALESCE((SELECT MAX(s."longestStreak") FROM "Streak" s WHERE s."userId" = u."id"), 0),
+    (SELECT MAX(w."date") FROM "Workout" w WHERE w."userId" = u."id"),
+    u."weight",
+    CAST(strftime('%s', 'now') AS INTEGER) * 1000
+FROM "User" u;
@@ -0,0 +1,31 @@
+-- CreateTable
+CREATE TABLE "DailyRollup" (
+    "userId" INTEGER NOT NULL,
+    "day" DATETIME NOT NULL,
+    "workouts" INTEGER NOT NULL DEFAULT 0,
+    "minutes" INTEGER NOT NULL DEFAULT 0,
+    "tonnage" REAL NOT NULL DEFAULT 0,
+    "exercises" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" DATETIME NOT NULL,
+
+    PRIMARY KEY ("userId", "day"),
+    CONSTRAINT "DailyRollup_userId_fkey" FOREIGN KEY ("userId") REFERENCES "User" ("id") ON DELETE RESTRICT ON UPDATE CASCADE
+);
+
+-- Backfill existing workouts (same as rebuild-stats.py)
+INSERT INTO "DailyRollup" ("userId", "day", "workouts", "minutes", "tonnage", "exercises", "updatedAt")
+SELECT
+    w."userId",
+    w."date" - w."date" % 86400000,
+    COUNT(*),
+    SUM(w."duration"),
+    COALESCE(SUM(x."tonnage"), 0),
+    COALESCE(SUM(x."exercises"), 0),
+    CAST(strftime('%s', 'now') AS INTEGER) * 1000
+FROM "Workout" w
+LEFT JOIN (
+    SELECT "workoutId", SUM("sets" * "reps" * COALESCE("weight", 0)) AS "tonnage", COUNT(*) AS "exercises"
+    FROM "Exercise"
+    GROUP BY "workoutId"
+) x ON x."workoutId" = w."id"
+GROUP BY w."userId", w."date" - w."date" % 86400000;
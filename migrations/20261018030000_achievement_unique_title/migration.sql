@@ -0,0 +1,11 @@
+-- Keep the first award of each title per user
+DELETE FROM "Achievement"
+WHERE "id" NOT IN (
+    SELECT MIN("id") FROM "Achievement" GROUP BY "userId", "title"
+);
+
+-- DropIndex
+DROP INDEX "Achievement_userId_title_idx";
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Achievement_userId_title_key" ON "Achievement"("userId", "title");
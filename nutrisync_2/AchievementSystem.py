@@ -1,145 +1,152 @@
 import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import pytz
 
+from nutrisync_2.DateUtils import to_epoch_ms
+
+from nutrisync_2.RollupSystem import RollupSystem
+from nutrisync_2.StatsSystem import StatsSystem
+
+WORKOUT_MILESTONES = {
+    1: "First Workout",
+    5: "Getting Started",
+    10: "Dedicated Athlete",
+    25: "Fitness Enthusiast",
+    50: "Workout Warrior",
+    100: "Centurion",
+    200: "Double Centurion",
+    365: "Year-Round Athlete"
+}
+
+STREAK_MILESTONES = {
+    3: "Three-Day Streak",
+    7: "Week Warrior",
+    14: "Two-Week Terror",
+    30: "Monthly Master",
+    60: "Consistency King",
+    90: "Quarterly Champion",
+    180: "Half-Year Hero",
+    365: "Year of Dedication"
+}
+
+VARIETY_MILESTONES = {
+    5: "Jack of All Trades",
+    10: "Exercise Explorer",
+    20: "Variety Virtuoso",
+    30: "Master of Many",
+}
+
+WEEKLY_MILESTONES = {
+    3: ("Weekly Warrior", "Completed 3 or more workouts in a week!"),
+    5: ("Five-Star Week", "Completed 5 or more workouts in a week!"),
+}
+
+MAX_CACHED_USERS = 1024  # least recently checked users' titles are dropped past this
+
+DURATION_MILESTONES = {
+    60: "Hour Champion",
+    90: "Endurance Explorer",
+    120: "Marathon Trainer"
+}
+
 class AchievementSystem:
+    """Awards milestone achievements after a workout is saved.
+
+    Earned titles are cached per user across saves and sessions, for at
+    most MAX_CACHED_USERS users. The cache only saves a query: the
+    (userId, title) unique index is what keeps a title from being awarded
+    twice, e.g. by two sessions of the same user.
+    """
+
+    _earned = OrderedDict()
+
     def __init__(self, db, user_id):
         self.db = db
         self.user_id = user_id
-        
+
+    @classmethod
+    def forget(cls, user_id):
+        """Reload earned titles on the next check, e.g. after achievements were deleted."""
+        cls._earned.pop(user_id, None)
+
     async def check_achievements(self):
-        """Check for new achievements after a workout is logged."""
+        """Check for new achievements after a workout is logged.
+
+        Totals are read from the UserStats row and the weekly count from
+        DailyRollup; earned titles are loaded on the first check for a user
+        and cached after that.
+        """
         achievements = []
-        
-        # Get all user workouts
-        workouts = await self.db.workout.find_many(
-            where={'userId': self.user_id},
-            include={'exercises': True}
-        )
-        
-        # Get current streak
-        streak = await self.db.streak.find_first(
-            where={'userId': self.user_id},
-            order={'endDate': 'desc'}
+        earned = self._earned.get(self.user_id)
+        if earned is None:
+            earned = await self._load_earned()
+            self._earned[self.user_id] = earned
+            while len(self._earned) > MAX_CACHED_USERS:
+                self._earned.popitem(last=False)
+        self._earned.move_to_end(self.user_id)
+
+        # The last 7 calendar days, today included
+        six_days_ago = datetime.now(pytz.utc) - timedelta(days=6)
+        stats, recent_count = await asyncio.gather(
+            StatsSystem(self.db, self.user_id).get(),
+            RollupSystem(self.db, self.user_id).workouts_since(six_days_ago),
         )
-        
+
+        candidates = []
+
         # Check total workouts achievements
-        total_workouts = len(workouts)
-        workout_milestones = {
-            1: "First Workout",
-            5: "Getting Started",
-            10: "Dedicated Athlete",
-            25: "Fitness Enthusiast",
-            50: "Workout Warrior",
-            100: "Centurion",
-            200: "Double Centurion",
-            365: "Year-Round Athlete"
-        }
-        
-        for count, title in workout_milestones.items():
-            if total_workouts >= count:
-                await self._award_achievement(
-                    title,
-                    f"Completed {count} workouts!",
-                    achievements
-                )
-        
+        for count, title in WORKOUT_MILESTONES.items():
+            if stats.totalWorkouts >= count:
+                candidates.append((title, f"Completed {count} workouts!"))
+
         # Check streak achievements
-        if streak:
-            streak_milestones = {
-                3: "Three-Day Streak",
-                7: "Week Warrior",
-                14: "Two-Week Terror",
-                30: "Monthly Master",
-                60: "Consistency King",
-                90: "Quarterly Champion",
-                180: "Half-Year Hero",
-                365: "Year of Dedication"
-            }
-            
-            for days, title in streak_milestones.items():
-                if streak.currentStreak >= days:
-                    await self._award_achievement(
-                        title,
-                        f"Maintained a {days}-day workout streak!",
-                        achievements
-                    )
-        
+        for days, title in STREAK_MILESTONES.items():
+            if stats.currentStreak >= days:
+                candidates.append((title, f"Maintained a {days}-day workout streak!"))
+
         # Check exercise variety achievements
-        unique_exercises = set()
-        for workout in workouts:
-            for exercise in workout.exercises:
-                unique_exercises.add(exercise.name)
-                
-        variety_milestones = {
-            5: "Jack of All Trades",
-            10: "Exercise Explorer",
-            20: "Variety Virtuoso",
-            30: "Master of Many",
-        }
-        
-        exercise_count = len(unique_exercises)
-        for count, title in variety_milestones.items():
-            if exercise_count >= count:
-                await self._award_achievement(
-                    title,
-                    f"Performed {count} different exercises!",
-                    achievements
-                )
-        
+        for count, title in VARIETY_MILESTONES.items():
+            if stats.distinctExercises >= count:
+                candidates.append((title, f"Performed {count} different exercises!"))
+
         # Check weekly consistency
-        now = datetime.now(pytz.utc)
-        one_week_ago = now - timedelta(days=7)
-        recent_workouts = [w for w in workouts if w.date >= one_week_ago]
-        
-        if len(recent_workouts) >= 3:
-            await self._award_achievement(
-                "Weekly Warrior",
-                "Completed 3 or more workouts in a week!",
-                achievements
-            )
-        
-        if len(recent_workouts) >= 5:
-            await self._award_achievement(
-                "Five-Star Week",
-                "Completed 5 or more workouts in a week!",
-                achievements
-            )
-        
+        for count, (title, description) in WEEKLY_MILESTONES.items():
+            if recent_count >= count:
+                candidates.append((title, description))
+
         # Check workout duration achievements
-        duration_milestones = {
-            60: "Hour Champion",
-            90: "Endurance Explorer",
-            120: "Marathon Trainer"
-        }
-        
-        for workout in workouts:
-            for duration, title in duration_milestones.items():
-                if workout.duration >= duration:
-                    await self._award_achievement(
-                        title,
-                        f"Completed a {duration}-minute workout!",
-                        achievements
-                    )
-        
+        for duration, title in DURATION_MILESTONES.items():
+            if stats.longestDuration >= duration:
+                candidates.append((title, f"Completed a {duration}-minute workout!"))
+
+        for title, description in candidates:
+            await self._award_achievement(title, description, achievements, earned)
+
         return achievements
-    
-    async def _award_achievement(self, title, description, achievements_list):
+
+    async def _load_earned(self):
+        earned = await self.db.achievement.find_many(
+            where={'userId': self.user_id}
+        )
+        return {a.title for a in earned}
+
+    async def _award_achievement(self, title, description, achievements_list, earned):
         """Award an achievement if it hasn't been earned yet."""
-        existing_achievement = await self.db.achievement.find_first(
-            where={
-                'userId': self.user_id,
-                'title': title
-            }
+        if title in earned:
+            return
+
+        # OR IGNORE: another session may have awarded it since the titles were loaded
+        inserted = await self.db.execute_raw(
+            'INSERT OR IGNORE INTO "Achievement" ("userId", "title", "description", "dateEarned") '
+            'VALUES (?, ?, ?, ?)',
+            self.user_id,
+            title,
+            description,
+            to_epoch_ms(datetime.now(pytz.utc)),
         )
-        
-        if not existing_achievement:
-            new_achievement = await self.db.achievement.create(
-                data={
-                    'userId': self.user_id,
-                    'title': title,
-                    'description': description,
-                    'dateEarned': datetime.now(pytz.utc)
-                }
-            )
-            achievements_list.append(new_achievement)
+        earned.add(title)
+        if inserted:
+            achievements_list.append(await self.db.achievement.find_unique(
+                where={'userId_title': {'userId': self.user_id, 'title': title}}
+            ))
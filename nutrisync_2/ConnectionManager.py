@@ -0,0 +1,170 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import httpx
+from prisma import Prisma
+from prisma.errors import ClientNotConnectedError, HTTPClientClosedError
+from prisma.engine.errors import EngineConnectionError
+
+from nutrisync_2.StorageProfile import StorageProfile
+from nutrisync_2.WriteBehind import WriteBehind
+
+# Errors that mean the query engine is gone rather than a query being wrong
+ENGINE_FAILURES = (
+    ClientNotConnectedError,
+    HTTPClientClosedError,
+    EngineConnectionError,
+    httpx.TransportError,
+)
+
+# Queries allowed in flight at once on the shared client, across all sessions
+MAX_CONCURRENT_QUERIES = int(os.environ.get("NUTRISYNC_MAX_CONCURRENT_QUERIES", "8"))
+
+class ConnectionManager:
+    """Keeps one Prisma query engine alive for the lifetime of the app.
+
+    Pages borrow the client with `async with manager.connection() as db:`
+    instead of connecting and disconnecting around every query, so two
+    overlapping tasks can never close the engine underneath each other.
+
+    In web mode every Flet session uses the process-wide instance from
+    `shared()`, so there is one engine however many sessions are open.
+    Sessions pass their user id to each query themselves; the manager
+    holds no per-user state.
+
+    A StorageProfile, if given, sets the SQLite pragmas each time the
+    engine connects and checkpoints the WAL before it is stopped.
+
+    Writes nobody waits on go through `write_behind`, which is drained
+    before the engine stops.
+    """
+
+    _shared = None
+
+    def __init__(self, db: Prisma, shutdown_timeout=5.0, max_concurrent_queries=None, storage_profile=None):
+        self.db = db
+        self.storage_profile = storage_profile
+        self.write_behind = WriteBehind(self)
+        self.shutdown_timeout = shutdown_timeout
+        self.users = 0
+        self.sessions = 0
+        self._slots = asyncio.Semaphore(max_concurrent_queries) if max_concurrent_queries else None
+        self._lock = asyncio.Lock()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._stale = False
+        self._closed = False
+
+    @classmethod
+    def shared(cls):
+        """The process-wide manager, created on first use."""
+        if cls._shared is None:
+            profile = StorageProfile.from_env()
+            cls._shared = cls(
+                Prisma(datasource={'url': profile.datasource_url()}),
+                max_concurrent_queries=MAX_CONCURRENT_QUERIES,
+                storage_profile=profile,
+            )
+        return cls._shared
+
+    def open_session(self):
+        """Register a Flet session; a closed manager becomes usable again."""
+        self.sessions += 1
+        self._closed = False
+
+    async def close_session(self):
+        """Unregister a session and stop the engine once the last one has gone."""
+        self.sessions = max(0, self.sessions - 1)
+        if self.sessions == 0:
+            await self.shutdown()
+
+    def engine_alive(self):
+        """Return True if the client is connected and its engine process is running."""
+        if not self.db.is_connected():
+            return False
+        process = getattr(self.db._engine, "process", None)
+        return process is None or process.poll() is None
+
+    async def _ensure_connected(self):
+        if not self._stale and self.engine_alive():
+            return
+
+        if self.db.is_connected():
+            print("Database engine is not responding. Reconnecting...")
+            try:
+                await self.db.disconnect()
+            except Exception as e:
+                print(f"Error closing dead database engine: {str(e)}")
+
+        await self.db.connect()
+        if self.storage_profile is not None:
+            await self.storage_profile.apply(self.db)
+        self._stale = False
+
+    async def acquire(self) -> Prisma:
+        """Connect if needed and register one more user of the client."""
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError("Database connection has been shut down")
+            await self._ensure_connected()
+            self.users += 1
+            self._idle.clear()
+        return self.db
+
+    def release(self):
+        self.users = max(0, self.users - 1)
+        if self.users == 0:
+            self._idle.set()
+
+    @asynccontextmanager
+    async def connection(self):
+        if self._slots is not None:
+            # Wait here rather than pile more queries onto the engine
+            await self._slots.acquire()
+        try:
+            db = await self.acquire()
+            try:
+                yield db
+            except ENGINE_FAILURES:
+                # Force a reconnect on the next acquire
+                self._stale = True
+                raise
+            finally:
+                self.release()
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    async def shutdown(self):
+        """Run queued writes, wait for running queries to finish, then stop the query engine.
+
+        Every wait can let a new session open, so the session count is
+        checked again under the lock after each one and the engine is kept
+        if anyone is using it.
+        """
+        try:
+            await asyncio.wait_for(self.write_behind.close(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            print("Closing database before all queued writes have run")
+
+        async with self._lock:
+            if self.sessions > 0:
+                return
+            self._closed = True
+
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            print(f"Closing database with {self.users} queries still running")
+
+        # acquire() waits on the lock, so no query can start while the engine stops
+        async with self._lock:
+            if self.sessions > 0 or not self.db.is_connected():
+                return
+            if self.storage_profile is not None:
+                try:
+                    await self.storage_profile.checkpoint(self.db)
+                except Exception as e:
+                    print(f"Error checkpointing database: {str(e)}")
+            await self.db.disconnect()
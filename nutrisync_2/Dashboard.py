@@ -1,6 +1,8 @@
 import flet as ft
 import datetime
 from nutrisync_2.Page import Page
+from nutrisync_2.DashboardSnapshot import DashboardSnapshot
+from nutrisync_2.QuoteDeck import QuoteDeck
 from functools import partial
 import asyncio
 from datetime import datetime, timedelta
@@ -16,6 +18,7 @@ class Dashboard(Page):
         self.weekly_target = 5  # Can be made configurable later
         self.achievements = []
         self.quote = None
+        self.prefetched_snapshot = None  # loaded by GymTrackerApp.login during the password check
 
     async def before_build(self):
         await self.load_dashboard_data()
@@ -25,75 +28,38 @@ class Dashboard(Page):
         return dt.astimezone(pytz.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
     async def load_dashboard_data(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        try:
-            # Load total visits
-            self.total_visits = await self.app.db.workout.count(
-                where={'userId': self.app.current_user_id}
-            )
-
-            # Load current streak
-            streak = await self.app.db.streak.find_first(
-                where={'userId': self.app.current_user_id},
-                order={'endDate': 'desc'}
-            )
-            self.current_streak = streak.currentStreak if streak else 0
-
-            # Load this week's workouts
-            week_start = datetime.now(pytz.utc) - timedelta(days=datetime.now(pytz.utc).weekday())
-            week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            self.weekly_progress = await self.app.db.workout.count(
-                where={
-                    'userId': self.app.current_user_id,
-                    'date': {
-                        'gte': self.to_rfc3339(week_start)
-                    }
-                }
-            )
-
-            # Load recent workouts
-            self.recent_workouts = await self.app.db.workout.find_many(
-                where={'userId': self.app.current_user_id},
-                order={'date': 'desc'},
-                take=5  # Get last 5 workouts
-            )
+        snapshot = self.prefetched_snapshot
+        self.prefetched_snapshot = None
+        if snapshot is None:
+            async with self.app.db_manager.connection() as db:
+                snapshot = await DashboardSnapshot.load(db, self.app.current_user_id)
 
-            # Load recent achievements
-            self.achievements = await self.app.db.achievement.find_many(
-                where={'userId': self.app.current_user_id},
-                order={'dateEarned': 'desc'},
-                take=3  # Get last 3 achievements
-            )
-
-            # Load random motivational quote
-            self.quote = await self.app.db.motivationalquote.find_first(
-                order=[{'dateDisplayed': 'asc'}]  # Get least recently displayed quote
-            )
-            
-            if self.quote:
-                # Update quote's display date
-                await self.app.db.motivationalquote.update(
-                    where={'id': self.quote.id},
-                    data={'dateDisplayed': self.to_rfc3339(datetime.now(pytz.utc))}
-                )
+        if snapshot.quote:
+            # The display date is bookkeeping; render without waiting for it
+            QuoteDeck.mark_displayed(snapshot.quote, self.app.db_manager.write_behind)
 
-        finally:
-            await self.app.db.disconnect()
+        self.total_visits = snapshot.total_visits
+        self.current_streak = snapshot.current_streak
+        self.weekly_progress = snapshot.weekly_progress
+        self.recent_workouts = snapshot.recent_workouts
+        self.achievements = snapshot.achievements
+        self.quote = snapshot.quote
 
     async def handle_async_navigation(self, route, _):
         asyncio.create_task(self.app.navigate(route))
 
+    async def refresh(self):
+        await self.load_dashboard_data()
+        self.render()
+
     def build(self):
-        def create_metric_container(title: str, value: str, icon: str):
+        def create_metric_container(title: str, value: ft.Text, icon: str):
             return ft.Container(
                 content=ft.Column(
                     [
                         ft.Icon(name=icon, size=24),
                         ft.Text(title, size=14, weight=ft.FontWeight.BOLD),
-                        ft.Text(value, size=20, weight=ft.FontWeight.BOLD),
+                        value,
                     ],
                     alignment=ft.MainAxisAlignment.CENTER,
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER,
@@ -105,6 +71,24 @@ class Dashboard(Page):
                 padding=10,
             )
 
+        # Controls that render() fills in, kept across visits
+        self.weekly_bar = ft.ProgressBar(width=None, height=20)
+        self.weekly_text = ft.Text(size=14, color=ft.colors.GREY)
+        self.total_visits_text = ft.Text(size=20, weight=ft.FontWeight.BOLD)
+        self.streak_text = ft.Text(size=20, weight=ft.FontWeight.BOLD)
+        self.quote_text = ft.Text(italic=True, size=14)
+        self.quote_author_text = ft.Text(size=12, color=ft.colors.GREY)
+        self.achievement_column = ft.Column(spacing=10)
+        self.workout_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Date")),
+                ft.DataColumn(ft.Text("Type")),
+                ft.DataColumn(ft.Text("Duration")),
+            ],
+        )
+        self.rendered_achievements = None
+        self.rendered_workouts = None
+
         # Weekly Progress Card
         weekly_progress = ft.Card(
             content=ft.Container(
@@ -114,17 +98,8 @@ class Dashboard(Page):
                             ft.Icon(ft.icons.CALENDAR_TODAY), 
                             ft.Text("This Week's Progress", weight=ft.FontWeight.BOLD)
                         ]),
-                        ft.ProgressBar(
-                            width=None, 
-                            value=self.weekly_progress / self.weekly_target 
-                            if self.weekly_target > 0 else 0,
-                            height=20
-                        ),
-                        ft.Text(
-                            f"{self.weekly_progress} out of {self.weekly_target} visits completed", 
-                            size=14, 
-                            color=ft.colors.GREY
-                        ),
+                        self.weekly_bar,
+                        self.weekly_text,
                     ],
                     spacing=10,
                 ),
@@ -137,12 +112,12 @@ class Dashboard(Page):
             [
                 create_metric_container(
                     "Total Visits", 
-                    str(self.total_visits), 
+                    self.total_visits_text, 
                     ft.icons.FITNESS_CENTER
                 ),
                 create_metric_container(
                     "Current Streak", 
-                    f"{self.current_streak} days", 
+                    self.streak_text, 
                     ft.icons.EMOJI_EVENTS
                 ),
             ],
@@ -162,16 +137,8 @@ class Dashboard(Page):
                 content=ft.Column(
                     [
                         ft.Text("Today's Motivation", weight=ft.FontWeight.BOLD),
-                        ft.Text(
-                            self.quote.quote if self.quote else "Stay consistent, stay strong!", 
-                            italic=True, 
-                            size=14
-                        ),
-                        ft.Text(
-                            f"- {self.quote.author}" if self.quote and self.quote.author else "",
-                            size=12,
-                            color=ft.colors.GREY
-                        ),
+                        self.quote_text,
+                        self.quote_author_text,
                     ],
                     spacing=10,
                 ),
@@ -180,6 +147,73 @@ class Dashboard(Page):
         )
 
         # Recent Achievements
+        recent_achievements = ft.Card(
+            content=ft.Container(
+                content=ft.Column(
+                    [
+                        ft.Text("Recent Achievements", weight=ft.FontWeight.BOLD),
+                        self.achievement_column,
+                    ],
+                    spacing=10,
+                ),
+                padding=20,
+            ),
+        )
+
+        # Recent Workouts
+        recent_workouts = ft.Card(
+            content=ft.Container(
+                content=ft.Column(
+                    [
+                        ft.Text("Recent Workouts", weight=ft.FontWeight.BOLD),
+                        self.workout_table,
+                    ],
+                    spacing=10,
+                ),
+                padding=20,
+            ),
+        )
+
+        self.render()
+
+        return ft.Column(
+            [
+                ft.Text("Dashboard", size=24, weight=ft.FontWeight.BOLD),
+                log_workout_button,
+                weekly_progress,
+                metrics_row,
+                motivational_quote,
+                recent_achievements,
+                recent_workouts,
+            ], 
+            spacing=20, 
+            scroll=ft.ScrollMode.AUTO
+        )
+
+    def render(self):
+        """Copy the loaded data onto the retained controls.
+
+        Scalar values are plain property updates; the achievement and
+        workout rows are only recreated when the records behind them change.
+        """
+        self.weekly_bar.value = self.weekly_progress / self.weekly_target if self.weekly_target > 0 else 0
+        self.weekly_text.value = f"{self.weekly_progress} out of {self.weekly_target} visits completed"
+        self.total_visits_text.value = str(self.total_visits)
+        self.streak_text.value = f"{self.current_streak} days"
+        self.quote_text.value = self.quote.quote if self.quote else "Stay consistent, stay strong!"
+        self.quote_author_text.value = f"- {self.quote.author}" if self.quote and self.quote.author else ""
+
+        achievement_ids = [achievement.id for achievement in self.achievements]
+        if achievement_ids != self.rendered_achievements:
+            self.rendered_achievements = achievement_ids
+            self.achievement_column.controls = self.create_achievement_items()
+
+        workout_ids = [workout.id for workout in self.recent_workouts]
+        if workout_ids != self.rendered_workouts:
+            self.rendered_workouts = workout_ids
+            self.workout_table.rows = self.create_workout_rows()
+
+    def create_achievement_items(self):
         achievement_items = []
         if self.achievements:
             for achievement in self.achievements:
@@ -198,21 +232,9 @@ class Dashboard(Page):
             achievement_items.append(
                 ft.Text("No achievements yet. Keep working!", size=14)
             )
+        return achievement_items
 
-        recent_achievements = ft.Card(
-            content=ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Text("Recent Achievements", weight=ft.FontWeight.BOLD),
-                        *achievement_items,
-                    ],
-                    spacing=10,
-                ),
-                padding=20,
-            ),
-        )
-
-        # Recent Workouts
+    def create_workout_rows(self):
         workout_rows = []
         if self.recent_workouts:
             for workout in self.recent_workouts:
@@ -239,37 +261,4 @@ class Dashboard(Page):
                     ]
                 )
             )
-
-        recent_workouts = ft.Card(
-            content=ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Text("Recent Workouts", weight=ft.FontWeight.BOLD),
-                        ft.DataTable(
-                            columns=[
-                                ft.DataColumn(ft.Text("Date")),
-                                ft.DataColumn(ft.Text("Type")),
-                                ft.DataColumn(ft.Text("Duration")),
-                            ],
-                            rows=workout_rows,
-                        ),
-                    ],
-                    spacing=10,
-                ),
-                padding=20,
-            ),
-        )
-
-        return ft.Column(
-            [
-                ft.Text("Dashboard", size=24, weight=ft.FontWeight.BOLD),
-                log_workout_button,
-                weekly_progress,
-                metrics_row,
-                motivational_quote,
-                recent_achievements,
-                recent_workouts,
-            ], 
-            spacing=20, 
-            scroll=ft.ScrollMode.AUTO
-        )
\ No newline at end of file
+        return workout_rows
@@ -0,0 +1,77 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Optional
+
+import pytz
+
+from nutrisync_2.DateUtils import to_epoch_ms
+from nutrisync_2.QuoteDeck import QuoteDeck
+from nutrisync_2.StreakSystem import streak_cutoff_ms
+
+if TYPE_CHECKING:
+    from prisma import Prisma
+    from prisma.models import Achievement, MotivationalQuote, Workout
+
+# Totals come from the UserStats and DailyRollup rows that the write paths keep current;
+# the streak reads as 0 once the last workout is older than the streak interval
+METRICS_QUERY = """
+SELECT
+    (SELECT "totalWorkouts" FROM "UserStats" WHERE "userId" = ?) AS "totalVisits",
+    (SELECT SUM("workouts") FROM "DailyRollup" WHERE "userId" = ? AND "day" >= ?) AS "weeklyProgress",
+    (SELECT CASE WHEN "lastWorkoutDate" >= ? THEN "currentStreak" ELSE 0 END
+        FROM "UserStats" WHERE "userId" = ?) AS "currentStreak"
+"""
+
+def week_start(now):
+    """Midnight UTC on the Monday of the week containing `now`."""
+    start = now - timedelta(days=now.weekday())
+    return start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+@dataclass
+class DashboardSnapshot:
+    """Everything the dashboard renders, read in one round of concurrent queries."""
+
+    total_visits: int = 0
+    weekly_progress: int = 0
+    current_streak: int = 0
+    recent_workouts: List['Workout'] = field(default_factory=list)
+    achievements: List['Achievement'] = field(default_factory=list)
+    quote: Optional['MotivationalQuote'] = None
+
+    @classmethod
+    async def load(cls, db: 'Prisma', user_id, now=None) -> 'DashboardSnapshot':
+        """Read the scalar metrics in one raw SQL statement and the lists alongside it."""
+        now = now or datetime.now(pytz.utc)
+
+        metrics, recent_workouts, achievements, quote = await asyncio.gather(
+            db.query_first(
+                METRICS_QUERY,
+                user_id,
+                user_id,
+                to_epoch_ms(week_start(now)),
+                streak_cutoff_ms(now),
+                user_id,
+            ),
+            db.workout.find_many(
+                where={'userId': user_id},
+                order={'date': 'desc'},
+                take=5,
+            ),
+            db.achievement.find_many(
+                where={'userId': user_id},
+                order={'dateEarned': 'desc'},
+                take=3,
+            ),
+            QuoteDeck.quote_for(db, user_id, now),
+        )
+
+        metrics = metrics or {}
+        return cls(
+            total_visits=int(metrics.get('totalVisits') or 0),
+            weekly_progress=int(metrics.get('weeklyProgress') or 0),
+            current_streak=int(metrics.get('currentStreak') or 0),
+            recent_workouts=recent_workouts,
+            achievements=achievements,
+            quote=quote,
+        )
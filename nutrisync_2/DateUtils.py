@@ -0,0 +1,18 @@
+from datetime import datetime
+
+import pytz
+
+# Prisma stores SQLite DateTime columns as milliseconds since the epoch, so
+# raw SQL has to compare and insert dates in that form.
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+def to_epoch_ms(dt):
+    """Convert a datetime to the integer Prisma stores in SQLite."""
+    return int(dt.timestamp() * 1000)
+
+def from_epoch_ms(value):
+    """Convert a raw SQLite DateTime value back to an aware UTC datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromtimestamp(int(value) / 1000, tz=pytz.utc)
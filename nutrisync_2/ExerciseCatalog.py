@@ -0,0 +1,113 @@
+import asyncio
+import bisect
+from datetime import datetime
+import pytz
+
+from nutrisync_2.DateUtils import to_epoch_ms
+
+class ExerciseCatalog:
+    """Every ExerciseOption, loaded once per process and shared by all pages and sessions.
+
+    `names()` is the sorted list the exercise dropdowns show and
+    `contains()` is a set lookup; type-ahead matching is ExerciseSearch's
+    job. New names go through `insert_missing()` on the save path and
+    `add()` once that commit has succeeded, so the cache never holds a name
+    the database rolled back. `version` changes on every load and add so
+    pages know to rebuild their options; `added()` lists the names added
+    since `loaded_version`, the version of the last full load.
+    """
+
+    _names = None        # sorted names
+    _categories = {}     # name: category
+    _added = []          # names added since the last load, oldest first
+    _lock = None
+    version = 0
+    loaded_version = None
+
+    @classmethod
+    async def load(cls, db):
+        """Read the table on first use; later calls return the cached names."""
+        if cls._names is not None:
+            return cls._names
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._names is None:
+                options = await db.exerciseoption.find_many()
+                cls._categories = {option.name: option.category for option in options}
+                cls._names = sorted(cls._categories)
+                cls._added = []
+                cls.version += 1
+                cls.loaded_version = cls.version
+        return cls._names
+
+    @classmethod
+    def loaded(cls):
+        return cls._names is not None
+
+    @classmethod
+    def names(cls):
+        return cls._names or []
+
+    @classmethod
+    def entries(cls):
+        """(name, category) pairs in name order."""
+        return [(name, cls._categories[name]) for name in cls.names()]
+
+    @classmethod
+    def added(cls):
+        """Names added since the last load, oldest first."""
+        return cls._added
+
+    @classmethod
+    def category(cls, name):
+        return cls._categories.get(name)
+
+    @classmethod
+    def contains(cls, name):
+        return name in cls._categories
+
+    @classmethod
+    async def insert_missing(cls, db, names):
+        """Insert the names the catalog doesn't have. Returns them for `add()` after commit.
+
+        The catalog must already be loaded: loading here would wait on the
+        class lock inside the caller's transaction, while a concurrent
+        loader holding it waits for a connection the transaction may hold.
+        """
+        if not cls.loaded():
+            raise RuntimeError("ExerciseCatalog.load() must run before the save transaction")
+        missing = sorted(name for name in names if not cls.contains(name))
+        if not missing:
+            return []
+
+        now = to_epoch_ms(datetime.now(pytz.utc))
+        params = []
+        for name in missing:
+            params.extend([name, now, now])
+        # OR IGNORE: another process may have added the same name since we loaded
+        await db.execute_raw(
+            'INSERT OR IGNORE INTO "ExerciseOption" ("name", "createdAt", "updatedAt") '
+            f'VALUES {", ".join(["(?, ?, ?)"] * len(missing))}',
+            *params,
+        )
+        return missing
+
+    @classmethod
+    def add(cls, names, category=None):
+        """Put committed names into the cache."""
+        added = False
+        for name in names:
+            if cls._names is None or cls.contains(name):
+                continue
+            cls._categories[name] = category
+            bisect.insort(cls._names, name)
+            cls._added.append(name)
+            added = True
+        if added:
+            cls.version += 1
+
+    @classmethod
+    def forget(cls):
+        """Reload the table on next use, e.g. after it was changed outside the app."""
+        cls._names = None
@@ -0,0 +1,153 @@
+import bisect
+import re
+
+import numpy as np
+
+from nutrisync_2.ExerciseCatalog import ExerciseCatalog
+
+TOP_K = 20
+PREFIX_BOOST = 1.0      # added when the whole name starts with the query
+CATEGORY_WEIGHT = 0.5   # share of the category's similarity given to each exercise in it
+
+def trigrams(text):
+    """Trigrams of each word, padded the way pg_trgm does so word starts weigh more."""
+    grams = set()
+    for word in re.findall(r"\w+", text.casefold()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def similarity(a, b):
+    """Share of trigrams two sets have in common."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+class ExerciseSearch:
+    """Trigram index over exercise names and categories for type-ahead.
+
+    Each trigram maps to a numpy array of the ids of the names containing
+    it; a query counts its trigrams' hits per name with one bincount,
+    scores them by trigram similarity, boosts whole-name prefix matches and
+    names in a matching category, and keeps the best `k`. Typos and partial
+    words still match, and a query costs well under a millisecond for
+    catalogs of thousands.
+
+    Ids are assigned in insertion order so `add()` only appends to the
+    arrays it touches. A separate case-folded sorted list, with the id at
+    each position, finds the prefix range by binary search and ranks equal
+    scores alphabetically.
+
+    `shared()` returns an index over the ExerciseCatalog. Names added to the
+    catalog are added to it in place; it is rebuilt only when the catalog
+    is reloaded.
+    """
+
+    _shared = None
+    _shared_load = None      # ExerciseCatalog.loaded_version the index was built from
+    _shared_added = 0        # how many of ExerciseCatalog.added() it holds
+    _shared_version = None
+
+    def __init__(self, entries=()):
+        """`entries` are (name, category) pairs; category may be None."""
+        self.names = []
+        self.sizes = np.zeros(0, dtype=np.float32)
+        self.folded = []                                # sorted case-folded names
+        self.sorted_ids = np.zeros(0, dtype=np.int32)   # id at each position of `folded`
+        self.rank = np.zeros(0, dtype=np.int32)         # position in `folded` of each id
+        self.postings = {}
+        self.categories = {}                            # category: (trigrams, case-folded, ids)
+
+        entries = list(entries)
+        postings = {}
+        sizes = []
+        categories = {}
+        for doc, (name, category) in enumerate(entries):
+            self.names.append(name)
+            grams = trigrams(name)
+            sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(doc)
+            if category:
+                categories.setdefault(category, []).append(doc)
+
+        self.postings = {gram: np.array(docs, dtype=np.int32) for gram, docs in postings.items()}
+        self.sizes = np.array(sizes, dtype=np.float32)
+        self.categories = {
+            category: (trigrams(category), category.casefold(), np.array(docs, dtype=np.int32))
+            for category, docs in categories.items()
+        }
+        order = sorted(range(len(self.names)), key=lambda doc: self.names[doc].casefold())
+        self.folded = [self.names[doc].casefold() for doc in order]
+        self.sorted_ids = np.array(order, dtype=np.int32)
+        self.rank = np.empty(len(order), dtype=np.int32)
+        self.rank[self.sorted_ids] = np.arange(len(order), dtype=np.int32)
+
+    def add(self, entries):
+        """Index more (name, category) pairs; costs a few array copies per name, not a rebuild."""
+        for name, category in entries:
+            doc = len(self.names)
+            self.names.append(name)
+            grams = trigrams(name)
+            self.sizes = np.append(self.sizes, np.float32(len(grams)))
+            for gram in grams:
+                self.postings[gram] = np.append(self.postings.get(gram, np.zeros(0, dtype=np.int32)), np.int32(doc))
+            if category:
+                category_grams, folded_category, docs = self.categories.get(
+                    category, (trigrams(category), category.casefold(), np.zeros(0, dtype=np.int32))
+                )
+                self.categories[category] = (category_grams, folded_category, np.append(docs, np.int32(doc)))
+
+            folded = name.casefold()
+            position = bisect.bisect_right(self.folded, folded)
+            self.folded.insert(position, folded)
+            self.sorted_ids = np.insert(self.sorted_ids, position, np.int32(doc))
+            self.rank[self.rank >= position] += 1
+            self.rank = np.append(self.rank, np.int32(position))
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None or cls._shared_load != ExerciseCatalog.loaded_version:
+            cls._shared = cls(ExerciseCatalog.entries())
+            cls._shared_load = ExerciseCatalog.loaded_version
+            cls._shared_added = len(ExerciseCatalog.added())
+        elif cls._shared_version != ExerciseCatalog.version:
+            new_names = ExerciseCatalog.added()[cls._shared_added:]
+            cls._shared.add((name, ExerciseCatalog.category(name)) for name in new_names)
+            cls._shared_added += len(new_names)
+        cls._shared_version = ExerciseCatalog.version
+        return cls._shared
+
+    def top_k(self, query, k=TOP_K):
+        """The `k` best matching names, best first; the first `k` names for an empty query."""
+        query = query.strip()
+        if not query or not self.names:
+            return [self.names[doc] for doc in self.sorted_ids[:k]]
+
+        grams = trigrams(query)
+        lists = [self.postings[gram] for gram in grams if gram in self.postings]
+        if lists:
+            hits = np.bincount(np.concatenate(lists), minlength=len(self.names))
+            # A name never has more hits than trigrams, so the union is at least len(grams) > 0
+            scores = hits / (len(grams) + self.sizes - hits)
+        else:
+            # No trigrams (e.g. only punctuation) or none indexed: prefix and category only
+            scores = np.zeros(len(self.names))
+
+        folded = query.casefold()
+        start = bisect.bisect_left(self.folded, folded)
+        end = bisect.bisect_left(self.folded, folded + "\uffff", lo=start)
+        scores[self.sorted_ids[start:end]] += PREFIX_BOOST
+
+        for category_grams, category, docs in self.categories.values():
+            weight = 1.0 if category.startswith(folded) else similarity(grams, category_grams)
+            if weight:
+                scores[docs] += CATEGORY_WEIGHT * weight
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # Best score first, alphabetical among equal scores
+        order = np.lexsort((self.rank[candidates], -scores[candidates]))
+        return [self.names[doc] for doc in candidates[order]]
@@ -2,6 +2,8 @@ import asyncio
 from datetime import datetime
 import pytz
 
+from nutrisync_2.StatsSystem import StatsSystem
+
 # Constants instead of enum
 class GoalType:
     TARGET_WEIGHT = 0
@@ -19,39 +21,45 @@ class GoalType:
         return "Unknown"
 
 class GoalSystem:
+    """Goal progress updates. Callers hold a connection from the app's ConnectionManager."""
+
     def __init__(self, db, user_id):
         self.db = db
         self.user_id = user_id
 
     async def check_and_update_goals(self, workout=None):
         """Updates all goals based on new workout data"""
-        if not self.db.is_connected():
-            await self.db.connect()
-
-        try:
-            active_goals = await self.db.goal.find_many(
-                where={
-                    'userId': self.user_id,
-                    'completed': False
-                }
-            )
+        active_goals = await self.db.goal.find_many(
+            where={
+                'userId': self.user_id,
+                'completed': False
+            }
+        )
 
-            for goal in active_goals:
-                if goal.goalType == GoalType.WORKOUT_COUNT:
-                    await self._update_workout_count_goal(goal)
-                elif goal.goalType == GoalType.EXERCISE_WEIGHT and workout:
-                    await self._update_exercise_weight_goal(goal, workout)
-                # TARGET_WEIGHT goals are updated manually when user inputs weight
+        # Heaviest weight per exercise in this workout, shared by all weight goals
+        bests = {}
+        for exercise in (workout.exercises if workout else None) or []:
+            if exercise.weight:
+                bests[exercise.name] = max(bests.get(exercise.name, 0), exercise.weight)
 
-        finally:
-            await self.db.disconnect()
+        for goal in active_goals:
+            if goal.goalType == GoalType.WORKOUT_COUNT:
+                await self._update_workout_count_goal(goal, workout)
+            elif goal.goalType == GoalType.EXERCISE_WEIGHT and goal.exerciseName in bests:
+                await self._update_exercise_weight_goal(goal, bests[goal.exerciseName])
+            # TARGET_WEIGHT goals are updated manually when user inputs weight
 
-    async def _update_workout_count_goal(self, goal):
+    async def _update_workout_count_goal(self, goal, workout=None):
         """Update progress for workout count goals"""
-        # Calculate the number of workouts in the target period
         start_date = goal.startDate
         end_date = goal.targetDate or datetime.now(pytz.utc)
 
+        # A workout outside the period can't change its count
+        if workout and not (start_date <= workout.date <= end_date):
+            return
+
+        # Recount rather than increment: the goal may predate workouts in its
+        # period, and the (userId, date) index keeps this a range scan
         workout_count = await self.db.workout.count(
             where={
                 'userId': self.user_id,
@@ -71,54 +79,47 @@ class GoalSystem:
             }
         )
 
-    async def _update_exercise_weight_goal(self, goal, workout):
+    async def _update_exercise_weight_goal(self, goal, best_weight):
         """Update progress for exercise weight goals"""
-        if not workout.exercises:
-            return
+        # Update if this is a new personal best
+        if best_weight > goal.currentValue:
+            await self.db.goal.update(
+                where={'id': goal.id},
+                data={
+                    'currentValue': float(best_weight),
+                    'completed': best_weight >= goal.targetValue
+                }
+            )
 
-        # Find matching exercise in workout
-        for exercise in workout.exercises:
-            if exercise.name == goal.exerciseName and exercise.weight:
-                # Update if this is a new personal best
-                if exercise.weight > goal.currentValue:
-                    await self.db.goal.update(
-                        where={'id': goal.id},
-                        data={
-                            'currentValue': float(exercise.weight),
-                            'completed': exercise.weight >= goal.targetValue
-                        }
-                    )
-
-    async def update_weight_goal(self, current_weight):
+    async def update_weight_goal(self, current_weight=None):
         """Update progress for weight-based goals"""
-        if not self.db.is_connected():
-            await self.db.connect()
-
-        try:
-            weight_goals = await self.db.goal.find_many(
-                where={
-                    'userId': self.user_id,
-                    'completed': False,
-                    'goalType': GoalType.TARGET_WEIGHT
-                }
+        if current_weight is None:
+            stats = await StatsSystem(self.db, self.user_id).get()
+            if stats.latestWeight is None:
+                return
+            current_weight = stats.latestWeight
+
+        weight_goals = await self.db.goal.find_many(
+            where={
+                'userId': self.user_id,
+                'completed': False,
+                'goalType': GoalType.TARGET_WEIGHT
+            }
+        )
+
+        for goal in weight_goals:
+            is_completed = (
+                (goal.targetValue > goal.currentValue and current_weight >= goal.targetValue) or
+                (goal.targetValue < goal.currentValue and current_weight <= goal.targetValue)
             )
 
-            for goal in weight_goals:
-                is_completed = (
-                    (goal.targetValue > goal.currentValue and current_weight >= goal.targetValue) or
-                    (goal.targetValue < goal.currentValue and current_weight <= goal.targetValue)
-                )
-
-                await self.db.goal.update(
-                    where={'id': goal.id},
-                    data={
-                        'currentValue': float(current_weight),
-                        'completed': is_completed
-                    }
-                )
-
-        finally:
-            await self.db.disconnect()
+            await self.db.goal.update(
+                where={'id': goal.id},
+                data={
+                    'currentValue': float(current_weight),
+                    'completed': is_completed
+                }
+            )
 
     def calculate_progress_percentage(self, goal):
         """Calculate the percentage progress for a goal"""
@@ -2,6 +2,7 @@ import flet as ft
 from datetime import datetime
 from nutrisync_2.Page import Page
 from nutrisync_2.GoalSystem import GoalSystem, GoalType
+from nutrisync_2.ExerciseCatalog import ExerciseCatalog
 import pytz
 
 class GoalTracker(Page):
@@ -99,18 +100,14 @@ class GoalTracker(Page):
         self.app.page.overlay.append(self.date_picker)
         
         # Load exercise options for exercise weight goals
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        self.exercise_options = await self.app.db.exerciseoption.find_many(
-            order={'name': 'asc'}
-        )
+        if not ExerciseCatalog.loaded():
+            async with self.app.db_manager.connection() as db:
+                await ExerciseCatalog.load(db)
+        self.exercise_options = ExerciseCatalog.names()
         self.exercise_dropdown.options = [
-            ft.dropdown.Option(ex.name) for ex in self.exercise_options
+            ft.dropdown.Option(ex) for ex in self.exercise_options
         ]
         
-        await self.app.db.disconnect()
-        
         # Load existing goals
         await self.load_goals()
         await self.app.page.update_async()
@@ -124,15 +121,11 @@ class GoalTracker(Page):
             self.app.page.update()
 
     async def load_goals(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        self.goals = await self.app.db.goal.find_many(
-            where={'userId': self.app.current_user_id},
-            order={'targetDate': 'asc'}
-        )
-        
-        await self.app.db.disconnect()
+        async with self.app.db_manager.connection() as db:
+            self.goals = await db.goal.find_many(
+                where={'userId': self.app.current_user_id},
+                order={'targetDate': 'asc'}
+            )
 
     def create_goal_card(self, goal):
         # Calculate progress
@@ -198,10 +191,7 @@ class GoalTracker(Page):
             )
             return
 
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        try:
+        async with self.app.db_manager.connection() as db:
             goal_type = self.goal_type_dropdown.value
             target_date = datetime.strptime(
                 self.target_date_text.value,
@@ -228,7 +218,7 @@ class GoalTracker(Page):
             else:  # WORKOUT_COUNT
                 goal_data['currentValue'] = 0  # Will be updated by goal system
 
-            await self.app.db.goal.create(data=goal_data)
+            await db.goal.create(data=goal_data)
 
             # Clear inputs
             self.title_input.value = ""
@@ -243,9 +233,6 @@ class GoalTracker(Page):
             self.app.page.show_snack_bar(
                 ft.SnackBar(content=ft.Text("New goal added successfully!"))
             )
-            
-        finally:
-            await self.app.db.disconnect()
 
     def build(self):
         # Create the goals list
@@ -1,41 +1,56 @@
 import flet as ft
 from prisma import Prisma
-import bcrypt
 import asyncio
+import os
 from functools import partial
 
 from nutrisync_2.Page import Page
-from nutrisync_2.Dashboard import Dashboard as DashboardPage
-from nutrisync_2.Profile import Profile as ProfilePage
-from nutrisync_2.History import History as HistoryPage
-from nutrisync_2.WorkoutLogger import WorkoutLogger as WorkoutLoggerPage
-from nutrisync_2.WorkoutPlans import WorkoutPlans as WorkoutPlansPage
-from nutrisync_2.ProgressTracking import ProgressTracking as ProgressTrackingPage
-from nutrisync_2.LoginPage import LoginPage
+from nutrisync_2.ConnectionManager import ConnectionManager
+from nutrisync_2.DashboardSnapshot import DashboardSnapshot
+from nutrisync_2.PageRegistry import PageRegistry
+from nutrisync_2.PasswordHasher import check_password
+from nutrisync_2.StartupTimer import StartupTimer
+
+# route: (module, class, page name); modules are imported on first navigation
+PAGE_ROUTES = {
+    "/": ("nutrisync_2.Dashboard", "Dashboard", "Dashboard"),
+    "/login": ("nutrisync_2.LoginPage", "LoginPage", "Login"),
+    "/profile": ("nutrisync_2.Profile", "Profile", "Profile"),
+    "/history": ("nutrisync_2.History", "History", "History"),
+    "/log-workout": ("nutrisync_2.WorkoutLogger", "WorkoutLogger", "Log Workout"),
+    # "/workout-plans": ("nutrisync_2.WorkoutPlans", "WorkoutPlans", "Workout Plans"),
+    "/progress": ("nutrisync_2.ProgressTracking", "ProgressTracking", "Progress Tracking"),
+}
+
+# Debug aid: print how many controls each navigation sends to the client
+REPORT_SENT_CONTROLS = os.environ.get("NUTRISYNC_REPORT_SENT_CONTROLS") == "1"
+
+def count_unsent_controls(control):
+    """Controls in a tree the client hasn't received yet, i.e. sent whole on the next update."""
+    unsent = 1 if control.uid is None else 0
+    return unsent + sum(count_unsent_controls(child) for child in control._get_children())
 
 class GymTrackerApp:
-    def __init__(self):
-        self.pages = {}
+    def __init__(self, startup_timer=None):
+        self.startup_timer = startup_timer or StartupTimer()
+        self.pages = PageRegistry(self, PAGE_ROUTES)
+        self.page_slots = {}  # route -> container holding that page's retained tree
         self.current_route = "/login"
         self.is_authenticated = False
         self.current_user_id = 0
-        self.db:Prisma = Prisma()
+        # One engine for every session in the process; this session only holds its user id
+        self.db_manager = ConnectionManager.shared()
+        self.db:Prisma = self.db_manager.db
 
 
     async def initialize(self, page: ft.Page):
+        self.startup_timer.mark("session started")
         self.page = page
         self.page.title = "GymTracker"
         self.page.theme_mode = ft.ThemeMode.LIGHT
         self.page.padding = 20
-
-        # Initialize pages
-        self.pages["/"] = DashboardPage(self, "Dashboard", "/")
-        self.pages["/login"] = LoginPage(self, "Login", "/login")
-        self.pages["/profile"] = ProfilePage(self, "Profile", "/profile")
-        self.pages["/history"] = HistoryPage(self, "History", "/history")
-        self.pages["/log-workout"] = WorkoutLoggerPage(self, "Log Workout", "/log-workout")
-        # self.pages["/workout-plans"] = WorkoutPlansPage(self, "Workout Plans", "/workout-plans")
-        self.pages["/progress"] = ProgressTrackingPage(self, "Progress Tracking", "/progress")
+        self.page.on_close = self.shutdown
+        self.db_manager.open_session()
 
         # Navigation bar
         self.nav_bar = ft.Row(
@@ -50,8 +65,8 @@ class GymTrackerApp:
             alignment=ft.MainAxisAlignment.SPACE_AROUND,
         )
 
-        # Main content area
-        self.content_area = ft.Container(content=self.pages["/login"].build(), expand=True)
+        # Main content area; each visited page keeps a slot here and only the current one is visible
+        self.content_area = ft.Column(expand=True)
 
         # Main layout
         self.main_column = ft.Column(
@@ -65,6 +80,8 @@ class GymTrackerApp:
 
         # Initial navigation
         await self.navigate("/login")
+        self.startup_timer.mark("first frame")
+        self.startup_timer.report()
 
     async def handle_async_navigation(self, route, _):
         asyncio.create_task(self.navigate(route))
@@ -74,11 +91,22 @@ class GymTrackerApp:
             print("User is not authenticated. Redirecting to login.")
             route = "/login"
         
-        # Call before_build to handle any async operations
-        await self.pages[route].before_build()
-        
-        # Now set the content using the synchronous build method
-        self.content_area.content = self.pages[route].build()
+        page = self.pages[route]
+        if page.view is None:
+            await page.mount()
+        else:
+            await page.refresh()
+
+        if route != self.current_route and self.current_route in self.page_slots:
+            self.pages[self.current_route].unmount()
+
+        slot = self.page_slots.get(route)
+        if slot is None:
+            slot = self.page_slots[route] = ft.Container(expand=True)
+            self.content_area.controls.append(slot)
+        slot.content = page.view
+        for slot_route, page_slot in self.page_slots.items():
+            page_slot.visible = slot_route == route
         self.current_route = route
         
         # Show/hide navigation bar based on the current route
@@ -90,19 +118,54 @@ class GymTrackerApp:
                 if isinstance(nav_button, ft.IconButton):
                     nav_button.disabled = nav_button.key == route
         
+        # Walks the whole tree, so only when asked for
+        sent = count_unsent_controls(self.content_area) if REPORT_SENT_CONTROLS else None
         await self.page.update_async()
+        if sent is not None:
+            print(f"Navigated to {route}: {sent} new controls sent")
 
     async def login(self, email, password):
-        if not self.db.is_connected():
-            await self.db.connect()
-        user = await self.db.user.find_first(where={'email': email})
-        if user and bcrypt.checkpw(password.encode('utf-8'), user.password.encode('utf-8')):
+        async with self.db_manager.connection() as db:
+            user = await db.user.find_first(where={'email': email})
+        if user is None:
+            self.page.show_snack_bar(ft.SnackBar(content=ft.Text("Invalid email or password")))
+            return
+
+        # Load the dashboard while the password is checked in the bcrypt pool
+        valid, snapshot = await asyncio.gather(
+            check_password(password, user.password),
+            self.warm_dashboard(user.id),
+        )
+        if valid:
             self.is_authenticated = True
             self.current_user_id = user.id
+            self.pages["/"].prefetched_snapshot = snapshot
             await self.navigate("/")  # Navigate to dashboard after successful login
         else:
             self.page.show_snack_bar(ft.SnackBar(content=ft.Text("Invalid email or password")))
 
+    async def warm_dashboard(self, user_id):
+        """Dashboard data for a user whose password is still being checked.
+
+        Read-only, and discarded unless the check passes. Returns None on
+        failure so the dashboard falls back to loading it itself.
+        """
+        try:
+            async with self.db_manager.connection() as db:
+                return await DashboardSnapshot.load(db, user_id)
+        except Exception as e:
+            print(f"Error preloading dashboard: {str(e)}")
+            return None
+
     async def logout(self):
         self.is_authenticated = False
-        await self.navigate("/login")
\ No newline at end of file
+        await self.navigate("/login")
+
+        # Drop the previous user's pages; the next login mounts them afresh
+        for route in [r for r in self.page_slots if r != "/login"]:
+            self.content_area.controls.remove(self.page_slots.pop(route))
+            self.pages.unload(route)
+        await self.page.update_async()
+
+    async def shutdown(self, _=None):
+        await self.db_manager.close_session()
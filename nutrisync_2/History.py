@@ -1,43 +1,137 @@
 import flet as ft
 from nutrisync_2.Page import Page
+from nutrisync_2.StatsSystem import StatsSystem
 from datetime import datetime
 
+PAGE_SIZE = 20  # workouts fetched per query
+MAX_CARDS = 100  # cards kept in memory; pages scrolled past are dropped and reloaded
+LOAD_THRESHOLD = 300  # pixels from either end of the list that trigger a page load
+
 class History(Page):
     def __init__(self, app, name, route):
         super().__init__(app, name, route)
         self.workouts = []
+        self.has_older = False
+        self.has_newer = False
+        self.loading = False
+        self.workout_list = None
+        self.stats_version = None  # UserStats (totalWorkouts, updatedAt) when the cards were loaded
 
     async def before_build(self):
         await self.load_workouts()
 
+    async def refresh(self):
+        # Keep the retained cards unless the user's workouts changed since they were loaded.
+        # A backdated workout can land anywhere in the loaded range, not just the newest page.
+        if await self.fetch_stats_version() != self.stats_version:
+            await self.load_workouts()
+            self.workout_list.controls = [self.create_workout_card(w) for w in self.workouts]
+
+    async def fetch_stats_version(self):
+        """One-row lookup that changes whenever a workout is recorded for the user."""
+        async with self.app.db_manager.connection() as db:
+            stats = await StatsSystem(db, self.app.current_user_id).get()
+        return (stats.totalWorkouts, stats.updatedAt) if stats else None
+
     async def load_workouts(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        self.workouts = await self.app.db.workout.find_many(
-            where={'userId': self.app.current_user_id},
-            order={'date': 'desc'},
-            include={
-                'exercises': True
-            }
-        )
-        await self.app.db.disconnect()
+        """Load the first page of the newest workouts."""
+        self.stats_version = await self.fetch_stats_version()
+        self.workouts = await self.fetch_page()
+        self.has_older = len(self.workouts) == PAGE_SIZE
+        self.has_newer = False
+
+    async def fetch_page(self, before=None, after=None):
+        """Fetch one page of workouts ordered newest first.
+
+        Pages are keyed on (date, id) rather than an offset, so each query
+        seeks straight to `before` or `after` through the (userId, date) index.
+        """
+        where = {'userId': self.app.current_user_id}
+        direction = 'desc'
+        if before:
+            where['OR'] = [
+                {'date': {'lt': before.date}},
+                {'date': before.date, 'id': {'lt': before.id}},
+            ]
+        elif after:
+            direction = 'asc'
+            where['OR'] = [
+                {'date': {'gt': after.date}},
+                {'date': after.date, 'id': {'gt': after.id}},
+            ]
+
+        async with self.app.db_manager.connection() as db:
+            page = await db.workout.find_many(
+                where=where,
+                order=[{'date': direction}, {'id': direction}],
+                take=PAGE_SIZE,
+                include={
+                    'exercises': True
+                }
+            )
+
+        if after:
+            page.reverse()
+        return page
+
+    async def on_scroll(self, e: ft.OnScrollEvent):
+        if self.loading:
+            return
+
+        self.loading = True
+        try:
+            if self.has_older and e.pixels >= e.max_scroll_extent - LOAD_THRESHOLD:
+                await self.load_older()
+            elif self.has_newer and e.pixels <= LOAD_THRESHOLD:
+                await self.load_newer()
+        finally:
+            self.loading = False
+
+    async def load_older(self):
+        page = await self.fetch_page(before=self.workouts[-1])
+        self.has_older = len(page) == PAGE_SIZE
+        self.workouts.extend(page)
+        self.workout_list.controls.extend(self.create_workout_card(w) for w in page)
+
+        overflow = len(self.workouts) - MAX_CARDS
+        if overflow > 0:
+            del self.workouts[:overflow]
+            del self.workout_list.controls[:overflow]
+            self.has_newer = True
+
+        self.workout_list.update()
+
+    async def load_newer(self):
+        page = await self.fetch_page(after=self.workouts[0])
+        self.has_newer = len(page) == PAGE_SIZE
+        self.workouts[:0] = page
+        self.workout_list.controls[:0] = [self.create_workout_card(w) for w in page]
+
+        overflow = len(self.workouts) - MAX_CARDS
+        if overflow > 0:
+            del self.workouts[-overflow:]
+            del self.workout_list.controls[-overflow:]
+            self.has_older = True
+
+        self.workout_list.update()
 
     def build(self):
-        workout_list = ft.ListView(
+        self.workout_list = ft.ListView(
             spacing=10,
             padding=20,
-            auto_scroll=True
+            expand=True,
+            on_scroll_interval=100,
+            on_scroll=self.on_scroll,
         )
 
         for workout in self.workouts:
             workout_card = self.create_workout_card(workout)
-            workout_list.controls.append(workout_card)
+            self.workout_list.controls.append(workout_card)
 
         return ft.Column([
             ft.Text("Workout History", size=24, weight=ft.FontWeight.BOLD),
-            workout_list
-        ], spacing=20, scroll=ft.ScrollMode.AUTO)
+            self.workout_list
+        ], spacing=20, expand=True)
 
     def create_workout_card(self, workout):
         exercises_list = ft.Column(
@@ -66,4 +160,4 @@ class History(Page):
                     ft.Text(f"Notes: {workout.notes or 'No notes'}", italic=True)
                 ], spacing=10)
             )
-        )
\ No newline at end of file
+        )
@@ -1,6 +1,6 @@
 import flet as ft
 from nutrisync_2.Page import Page
-import bcrypt
+from nutrisync_2.PasswordHasher import hash_password
 
 class LoginPage(Page):
     def __init__(self, app, name, route):
@@ -80,6 +80,14 @@ class LoginPage(Page):
             padding=50,
         )
 
+    async def refresh(self):
+        # Nothing on the login form comes from the database
+        pass
+
+    def unmount(self):
+        # Don't keep the password around once the user is past the login screen
+        self.password_input.value = ""
+
     def toggle_signup(self, _):
         self.show_signup = not self.show_signup
         self.login_form.visible = not self.show_signup
@@ -120,19 +128,18 @@ class LoginPage(Page):
             return
 
 
-        # Hash the password
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+        # Hash the password in the bcrypt pool, off the event loop
+        hashed_password = await hash_password(password)
 
         # Add user to the database
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
         try:
-            new_user = await self.app.db.user.create(
-                data={
-                    'email': email,
-                    'password': hashed_password.decode('utf-8'),  # Store the hashed password as a string
-                }
-            )
+            async with self.app.db_manager.connection() as db:
+                new_user = await db.user.create(
+                    data={
+                        'email': email,
+                        'password': hashed_password,  # Store the hashed password as a string
+                    }
+                )
             self.app.page.show_snack_bar(ft.SnackBar(content=ft.Text("Sign up successful! Please log in.")))
             self.toggle_signup(None)  # Switch back to login form
         except Exception as e:
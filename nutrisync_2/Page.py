@@ -10,6 +10,7 @@ class Page:
         self.app = app
         self.name = name
         self.route = route
+        self.view = None  # control tree kept across visits once mounted
     
     async def before_build(self):
         # Perform any async operations here
@@ -17,4 +18,20 @@ class Page:
 
     def build(self):
         raise NotImplementedError
-    
\ No newline at end of file
+
+    async def mount(self):
+        """First visit: load data and build the control tree later visits reuse."""
+        await self.before_build()
+        self.view = self.build()
+
+    async def refresh(self):
+        """Later visits: bring the retained tree up to date.
+
+        The default rebuilds the whole tree; pages override it to update
+        only the controls whose data changed.
+        """
+        await self.mount()
+
+    def unmount(self):
+        """Called when navigating away; the tree stays in place, hidden."""
+        pass
@@ -0,0 +1,50 @@
+import importlib
+import time
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nutrisync_2.GymTrackerApp import GymTrackerApp
+    from nutrisync_2.Page import Page
+
+class PageRegistry:
+    """Route table whose pages are imported and constructed on first navigation.
+
+    `routes` maps a route to (module, class name, page name). Nothing is
+    imported until a route is first requested, so startup only pays for the
+    login page; every later visit reuses the page object.
+    """
+
+    def __init__(self, app: 'GymTrackerApp', routes):
+        self.app = app
+        self.routes = routes
+        self.loaded = {}
+
+    def __contains__(self, route):
+        return route in self.routes
+
+    def __getitem__(self, route) -> 'Page':
+        page = self.loaded.get(route)
+        if page is None:
+            page = self.load(route)
+        return page
+
+    def unload(self, route):
+        """Forget a constructed page so the next visit builds a new one."""
+        self.loaded.pop(route, None)
+
+    def load(self, route):
+        module_name, class_name, name = self.routes[route]
+
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        imported = time.perf_counter()
+        page = getattr(module, class_name)(self.app, name, route)
+        constructed = time.perf_counter()
+
+        print(
+            f"Loaded page {route}: import {(imported - started) * 1000:.1f} ms, "
+            f"construct {(constructed - imported) * 1000:.1f} ms"
+        )
+        self.loaded[route] = page
+        return page
@@ -0,0 +1,21 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+MAX_HASH_WORKERS = 4  # bcrypt calls allowed to run at once across all sessions
+
+# bcrypt releases the GIL while it works, so threads give real parallelism
+# and the event loop stays free; extra calls queue for a free worker
+_executor = ThreadPoolExecutor(max_workers=MAX_HASH_WORKERS, thread_name_prefix="bcrypt")
+
+async def hash_password(password):
+    """bcrypt hash of `password` as a str, computed in the worker pool."""
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(_executor, bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt())
+    return hashed.decode('utf-8')
+
+async def check_password(password, hashed):
+    """True if `password` matches the stored bcrypt hash, checked in the worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8'))
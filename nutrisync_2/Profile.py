@@ -1,5 +1,7 @@
 import flet as ft
 from nutrisync_2.Page import Page
+from nutrisync_2.StatsSystem import StatsSystem
+from nutrisync_2.ProgressSeries import ProgressSeries
 from datetime import datetime
 import pytz
 
@@ -84,44 +86,38 @@ class Profile(Page):
         )
 
     async def load_user_data(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        try:
-            self.user_data = await self.app.db.user.find_unique(
+        async with self.app.db_manager.connection() as db:
+            self.user_data = await db.user.find_unique(
                 where={'id': self.app.current_user_id}
             )
 
-            self.weight_history = await self.app.db.weighthistory.find_many(
+            self.weight_history = await db.weighthistory.find_many(
                 where={'userId': self.app.current_user_id},
                 order={'date': 'desc'},
                 take=5  # Get last 5 weight entries
             )
 
-            # Populate form fields
-            self.name_input.value = self.user_data.name or ""
-            self.email_input.value = self.user_data.email
-            self.height_input.value = str(self.user_data.height) if self.user_data.height else ""
-            self.weight_input.value = str(self.user_data.weight) if self.user_data.weight else ""
-            self.age_input.value = str(self.user_data.age) if self.user_data.age else ""
-            self.gender_dropdown.value = self.user_data.gender
-            self.goal_dropdown.value = self.user_data.goal
-
-            # Update BMI
-            self.calculate_bmi(None)
+        # Populate form fields
+        self.name_input.value = self.user_data.name or ""
+        self.email_input.value = self.user_data.email
+        self.height_input.value = str(self.user_data.height) if self.user_data.height else ""
+        self.weight_input.value = str(self.user_data.weight) if self.user_data.weight else ""
+        self.age_input.value = str(self.user_data.age) if self.user_data.age else ""
+        self.gender_dropdown.value = self.user_data.gender
+        self.goal_dropdown.value = self.user_data.goal
 
-            # Update weight history display
-            if self.weight_history:
-                history_text = "Recent Weight History:\n"
-                for entry in self.weight_history:
-                    date_str = entry.date.strftime("%Y-%m-%d")
-                    history_text += f"• {date_str}: {entry.weight} kg\n"
-                self.weight_history_text.value = history_text
-            else:
-                self.weight_history_text.value = "No weight history available"
+        # Update BMI
+        self.calculate_bmi(None)
 
-        finally:
-            await self.app.db.disconnect()
+        # Update weight history display
+        if self.weight_history:
+            history_text = "Recent Weight History:\n"
+            for entry in self.weight_history:
+                date_str = entry.date.strftime("%Y-%m-%d")
+                history_text += f"• {date_str}: {entry.weight} kg\n"
+            self.weight_history_text.value = history_text
+        else:
+            self.weight_history_text.value = "No weight history available"
 
     def calculate_bmi(self, _):
         try:
@@ -156,9 +152,6 @@ class Profile(Page):
             self.app.page.update()
 
     async def save_profile(self, _):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
         try:
             # Prepare update data
             update_data = {
@@ -170,24 +163,34 @@ class Profile(Page):
                 'goal': self.goal_dropdown.value
             }
 
-            # Update user profile
-            await self.app.db.user.update(
-                where={'id': self.app.current_user_id},
-                data=update_data
-            )
-
-            # Add weight history entry if weight changed
-            if (self.weight_input.value and 
-                (not self.user_data.weight or 
-                 float(self.weight_input.value) != self.user_data.weight)):
-                await self.app.db.weighthistory.create(
-                    data={
-                        'userId': self.app.current_user_id,
-                        'weight': float(self.weight_input.value),
-                        'date': datetime.now(pytz.utc)
-                    }
+            weight_changed = False
+            async with self.app.db_manager.connection() as db, db.tx() as tx:
+                # Update user profile
+                await tx.user.update(
+                    where={'id': self.app.current_user_id},
+                    data=update_data
                 )
 
+                # Add weight history entry if weight changed
+                if (self.weight_input.value and 
+                    (not self.user_data.weight or 
+                     float(self.weight_input.value) != self.user_data.weight)):
+                    await tx.weighthistory.create(
+                        data={
+                            'userId': self.app.current_user_id,
+                            'weight': float(self.weight_input.value),
+                            'date': datetime.now(pytz.utc)
+                        }
+                    )
+                    await StatsSystem(tx, self.app.current_user_id).record_weight(
+                        float(self.weight_input.value)
+                    )
+                    weight_changed = True
+
+            # Only after commit, so a concurrent chart load can't re-cache the old series
+            if weight_changed:
+                ProgressSeries.forget(self.app.current_user_id)
+
             self.app.page.show_snack_bar(
                 ft.SnackBar(content=ft.Text("Profile updated successfully!"))
             )
@@ -201,12 +204,13 @@ class Profile(Page):
             self.app.page.show_snack_bar(
                 ft.SnackBar(content=ft.Text(f"Error updating profile: {str(e)}"))
             )
-        finally:
-            await self.app.db.disconnect()
 
     async def before_build(self):
         await self.load_user_data()
 
+    async def refresh(self):
+        await self.load_user_data()
+
     def build(self):
         # Add callbacks for BMI calculation
         self.height_input.on_change = self.calculate_bmi
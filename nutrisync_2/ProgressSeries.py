@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+import pytz
+
+from nutrisync_2.DateUtils import to_epoch_ms
+from nutrisync_2.ProgressStats import RANGE_DAYS, ProgressStats
+from nutrisync_2.RollupSystem import day_start_ms
+
+CHART_POINTS = 60  # default resolution: points sent to the client per series
+MAX_CACHED_SERIES = 2048  # least recently used series are dropped past this
+
+WEIGHT_SERIES_QUERY = """
+SELECT "date" + 0 AS "date", "weight"
+FROM "WeightHistory"
+WHERE "userId" = ? AND "date" >= ?
+ORDER BY "date", "id"
+"""
+
+# Heaviest set per workout, one row per (exercise, workout)
+EXERCISE_SERIES_QUERY = """
+SELECT e."name", w."date" + 0 AS "date", MAX(e."weight") AS "weight"
+FROM "Exercise" e
+JOIN "Workout" w ON w."id" = e."workoutId"
+WHERE w."userId" = ? AND w."date" >= ? AND e."weight" > 0 AND e."name" IN ({names})
+GROUP BY e."name", w."id"
+ORDER BY e."name", w."date", w."id"
+"""
+
+def lttb(x, y, target):
+    """Largest-Triangle-Three-Buckets downsampling to `target` points.
+
+    Keeps the first and last points and, per bucket, the point spanning the
+    largest triangle with its neighbours. The series minimum and maximum
+    replace their bucket's pick, so troughs and PRs survive (the maximum
+    wins if both fall in one bucket).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if target >= n or target < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, target - 1).astype(np.int64)
+    keep = np.empty(target, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    selected = 0
+    for bucket in range(target - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        following = slice(end, edges[bucket + 2]) if bucket + 2 < len(edges) else slice(n - 1, n)
+        avg_x, avg_y = x[following].mean(), y[following].mean()
+
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        keep[bucket + 1] = selected
+
+    for extreme in (int(np.argmin(y)), int(np.argmax(y))):
+        if 0 < extreme < n - 1 and extreme not in keep:
+            keep[np.searchsorted(edges, extreme, side='right')] = extreme
+
+    return x[keep], y[keep]
+
+class ProgressSeries:
+    """Downsampled chart series for WeightHistory and exercise weights.
+
+    Series are cached per (user, day, series, range, resolution), so a
+    relative range like "week" is read again once the day changes, and at
+    most MAX_CACHED_SERIES are kept, least recently used dropped first.
+    Write paths call `forget` after they commit so the next chart load
+    reads fresh data.
+    """
+
+    _cache = OrderedDict()
+
+    def __init__(self, db, user_id):
+        self.db = db
+        self.user_id = user_id
+
+    @classmethod
+    def forget(cls, user_id):
+        """Drop every cached series for a user after a write."""
+        for key in [key for key in cls._cache if key[0] == user_id]:
+            del cls._cache[key]
+
+    @classmethod
+    def _cached(cls, key):
+        series = cls._cache.get(key)
+        if series is not None:
+            cls._cache.move_to_end(key)
+        return series
+
+    @classmethod
+    def _store(cls, key, series):
+        cls._cache[key] = series
+        cls._cache.move_to_end(key)
+        while len(cls._cache) > MAX_CACHED_SERIES:
+            cls._cache.popitem(last=False)
+
+    def _key(self, series, date_range, resolution):
+        return (self.user_id, day_start_ms(datetime.now(pytz.utc)), series, date_range, resolution)
+
+    @staticmethod
+    def range_start_ms(date_range):
+        """Epoch ms where a range option starts; "all" starts at the epoch."""
+        if date_range not in RANGE_DAYS:
+            return 0
+        return to_epoch_ms(ProgressStats.range_start(date_range))
+
+    async def weight_history(self, date_range, resolution=CHART_POINTS):
+        """Body weight as ([epoch ms, ...], [kg, ...])."""
+        key = self._key('weight', date_range, resolution)
+        series = self._cached(key)
+        if series is None:
+            rows = await self.db.query_raw(WEIGHT_SERIES_QUERY, self.user_id, self.range_start_ms(date_range))
+            x, y = lttb([row['date'] for row in rows], [row['weight'] for row in rows], resolution)
+            series = (x.tolist(), y.tolist())
+            self._store(key, series)
+        return series
+
+    async def exercise_weights(self, names, date_range, resolution=CHART_POINTS):
+        """{name: ([epoch ms, ...], [kg, ...])}; uncached names are read in one query."""
+        keys = {name: self._key(f'exercise:{name}', date_range, resolution) for name in names}
+        found = {name: self._cached(key) for name, key in keys.items()}
+        missing = sorted(name for name, series in found.items() if series is None)
+
+        if missing:
+            query = EXERCISE_SERIES_QUERY.format(names=", ".join(["?"] * len(missing)))
+            rows = await self.db.query_raw(query, self.user_id, self.range_start_ms(date_range), *missing)
+
+            points = {name: ([], []) for name in missing}
+            for row in rows:
+                points[row['name']][0].append(row['date'])
+                points[row['name']][1].append(row['weight'])
+
+            for name, (dates, weights) in points.items():
+                x, y = lttb(dates, weights, resolution)
+                found[name] = (x.tolist(), y.tolist())
+                self._store(keys[name], found[name])
+
+        return found
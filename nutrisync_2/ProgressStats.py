@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytz
+
+from nutrisync_2.DateUtils import DAY_MS, to_epoch_ms
+from nutrisync_2.RollupSystem import day_start_ms
+
+# Days covered by each option of the ProgressTracking date range selector
+RANGE_DAYS = {
+    "week": 7,
+    "month": 30,
+    "year": 365,
+}
+
+ROLLING_WINDOW = 5  # latest weighted entries averaged into the rolling 1RM
+
+WORKOUTS_PER_DAY_QUERY = """
+SELECT strftime('%Y-%m-%d', "day" / 1000, 'unixepoch') AS "day", "workouts"
+FROM "DailyRollup"
+WHERE "userId" = ? AND "day" >= ?
+ORDER BY "day"
+"""
+
+# Per exercise over the range, in one pass: entry order follows workout date,
+# then entry order within a workout. Only weighted entries count, as they
+# always have on this page. 1RM is the Epley estimate, and a single rep is
+# the weight itself.
+EXERCISE_PROGRESS_QUERY = f"""
+SELECT
+    "name",
+    COUNT(*) AS "entries",
+    MAX("weight") AS "maxWeight",
+    MAX(CASE WHEN "fromStart" = 1 THEN "weight" END) AS "firstWeight",
+    MAX(CASE WHEN "fromEnd" = 1 THEN "weight" END) AS "lastWeight",
+    MAX("oneRm") AS "best1rm",
+    AVG(CASE WHEN "fromEnd" <= {ROLLING_WINDOW} THEN "oneRm" END) AS "rolling1rm",
+    SUM("tonnage") AS "tonnage",
+    SUM(CASE WHEN "age" >= 0 AND "age" < {7 * DAY_MS} THEN "tonnage" ELSE 0 END)
+        - SUM(CASE WHEN "age" >= {7 * DAY_MS} AND "age" < {14 * DAY_MS} THEN "tonnage" ELSE 0 END)
+        AS "weeklyTonnageDelta"
+FROM (
+    SELECT
+        e."name",
+        e."weight",
+        CASE WHEN e."reps" > 1 THEN e."weight" * (1 + e."reps" / 30.0) ELSE e."weight" END AS "oneRm",
+        e."sets" * e."reps" * e."weight" AS "tonnage",
+        ? - w."date" AS "age",
+        ROW_NUMBER() OVER (PARTITION BY e."name" ORDER BY w."date", e."id") AS "fromStart",
+        ROW_NUMBER() OVER (PARTITION BY e."name" ORDER BY w."date" DESC, e."id" DESC) AS "fromEnd"
+    FROM "Exercise" e
+    JOIN "Workout" w ON w."id" = e."workoutId"
+    WHERE w."userId" = ? AND w."date" >= ? AND e."weight" > 0
+)
+GROUP BY "name"
+ORDER BY "name"
+"""
+
+class ProgressStats:
+    """Aggregate queries behind the ProgressTracking page.
+
+    Workout counts come from DailyRollup and exercise statistics from one
+    GROUP BY, so each method returns a handful of rows for the requested
+    range and widening the range does not change how much data reaches
+    Python.
+    """
+
+    def __init__(self, db, user_id):
+        self.db = db
+        self.user_id = user_id
+
+    @staticmethod
+    def range_start(date_range, now=None):
+        now = now or datetime.now(pytz.utc)
+        return now - timedelta(days=RANGE_DAYS.get(date_range, RANGE_DAYS["month"]))
+
+    async def workouts_per_day(self, since):
+        """[{'day': 'YYYY-MM-DD', 'workouts': n}, ...] in date order."""
+        rows = await self.db.query_raw(WORKOUTS_PER_DAY_QUERY, self.user_id, day_start_ms(since))
+        return [{'day': row['day'], 'workouts': int(row['workouts'])} for row in rows]
+
+    async def exercise_progress(self, since, now=None):
+        """Per exercise within the range: weighted entries, first/last/max weight, 1RM and tonnage."""
+        now_ms = to_epoch_ms(now or datetime.now(pytz.utc))
+        rows = await self.db.query_raw(EXERCISE_PROGRESS_QUERY, now_ms, self.user_id, to_epoch_ms(since))
+        return [
+            {
+                'name': row['name'],
+                'entries': int(row['entries']),
+                'first_weight': float(row['firstWeight']),
+                'last_weight': float(row['lastWeight']),
+                'max_weight': float(row['maxWeight']),
+                'best_1rm': float(row['best1rm']),
+                'rolling_1rm': float(row['rolling1rm']),
+                'tonnage': float(row['tonnage']),
+                'weekly_tonnage_delta': float(row['weeklyTonnageDelta']),
+            }
+            for row in rows
+        ]
+
+    async def load(self, date_range):
+        """Both aggregates for a date range option, queried concurrently."""
+        since = self.range_start(date_range)
+        return await asyncio.gather(
+            self.workouts_per_day(since),
+            self.exercise_progress(since),
+        )
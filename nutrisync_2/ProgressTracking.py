@@ -1,13 +1,16 @@
 import flet as ft
+from nutrisync_2.DateUtils import DAY_MS
 from nutrisync_2.Page import Page
-from datetime import datetime, timedelta
-import pytz
-from collections import defaultdict
+from nutrisync_2.ProgressStats import ProgressStats, RANGE_DAYS
+from nutrisync_2.ProgressSeries import ProgressSeries
 
 class ProgressTracking(Page):
     def __init__(self, app, name, route):
         super().__init__(app, name, route)
-        self.workouts = []
+        self.daily_counts = []
+        self.exercise_stats = []
+        self.weight_series = ([], [])
+        self.exercise_series = {}
         self.date_range = "month"
         self.workout_stats = ft.Column(spacing=10)
         self.exercise_progress = ft.Column(spacing=10)
@@ -16,43 +19,55 @@ class ProgressTracking(Page):
         await self.load_workouts()
         self.process_workout_data()
 
+    async def refresh(self):
+        await self.load_workouts()
+        self.process_workout_data()
+
     async def load_workouts(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        # Get workouts for the last 30 days
-        thirty_days_ago = datetime.now(pytz.utc) - timedelta(days=30)
-        
-        self.workouts = await self.app.db.workout.find_many(
-            where={
-                'userId': self.app.current_user_id,
-                'date': {
-                    'gte': thirty_days_ago.isoformat()
-                }
-            },
-            include={
-                'exercises': True
-            },
-            order={
-                'date': 'asc'
-            }
+        # Aggregates for the selected range, plus chart series already downsampled
+        async with self.app.db_manager.connection() as db:
+            progress_stats = ProgressStats(db, self.app.current_user_id)
+            self.daily_counts, self.exercise_stats = await progress_stats.load(self.date_range)
+
+            progress_series = ProgressSeries(db, self.app.current_user_id)
+            self.weight_series = await progress_series.weight_history(self.date_range)
+            self.exercise_series = await progress_series.exercise_weights(
+                [e['name'] for e in self.exercise_stats if e['entries'] > 1],
+                self.date_range,
+            )
+
+    def build_line_chart(self, series, color):
+        """Line chart of a downsampled (epoch ms, value) series, x in days from its first point."""
+        dates, values = series
+        return ft.LineChart(
+            data_series=[
+                ft.LineChartData(
+                    data_points=[
+                        ft.LineChartDataPoint((date - dates[0]) / DAY_MS, value)
+                        for date, value in zip(dates, values)
+                    ],
+                    stroke_width=2,
+                    color=color,
+                    curved=True,
+                )
+            ],
+            height=120,
+            expand=True,
         )
-        
-        await self.app.db.disconnect()
 
     def process_workout_data(self):
-        # Process workout statistics
-        workout_by_date = defaultdict(int)
-        for workout in self.workouts:
-            date = workout.date.strftime("%Y-%m-%d") if isinstance(workout.date, datetime) else workout.date.split('T')[0]
-            workout_by_date[date] += 1
-
         # Clear existing stats
         self.workout_stats.controls.clear()
         
         # Add workout frequency stats
-        total_workouts = len(self.workouts)
-        avg_workouts_per_week = total_workouts / 4  # Assuming monthly view
+        total_workouts = sum(d['workouts'] for d in self.daily_counts)
+        avg_workouts_per_week = total_workouts / (RANGE_DAYS[self.date_range] / 7)
+
+        if self.daily_counts:
+            busiest = max(self.daily_counts, key=lambda d: d['workouts'])
+            most_active_day = f"{busiest['day']} ({busiest['workouts']} workouts)"
+        else:
+            most_active_day = "No workouts yet"
         
         self.workout_stats.controls.extend([
             ft.Card(
@@ -62,34 +77,39 @@ class ProgressTracking(Page):
                         ft.Divider(),
                         ft.Text(f"Total Workouts: {total_workouts}"),
                         ft.Text(f"Average Workouts per Week: {avg_workouts_per_week:.1f}"),
-                        ft.Text(f"Most Active Day: {max(workout_by_date.items(), key=lambda x: x[1])[0]} ({max(workout_by_date.values())} workouts)"),
+                        ft.Text(f"Most Active Day: {most_active_day}"),
                     ]),
                     padding=20,
                 )
             )
         ])
 
-        # Process exercise progress
-        exercise_progress = defaultdict(list)
-        for workout in self.workouts:
-            for exercise in workout.exercises:
-                if exercise.weight:
-                    exercise_progress[exercise.name].append({
-                        'date': workout.date,
-                        'weight': exercise.weight
-                    })
+        if len(self.weight_series[0]) > 1:
+            self.workout_stats.controls.append(
+                ft.Card(
+                    content=ft.Container(
+                        content=ft.Column([
+                            ft.Text("Body Weight", size=18, weight=ft.FontWeight.BOLD),
+                            ft.Divider(),
+                            self.build_line_chart(self.weight_series, ft.colors.BLUE),
+                        ]),
+                        padding=20,
+                    )
+                )
+            )
 
         # Clear existing progress cards
         self.exercise_progress.controls.clear()
 
         # Create progress cards
-        for exercise_name, data in exercise_progress.items():
-            if len(data) > 1:
-                initial_weight = data[0]['weight']
-                current_weight = data[-1]['weight']
+        for exercise in self.exercise_stats:
+            if exercise['entries'] > 1:
+                exercise_name = exercise['name']
+                initial_weight = exercise['first_weight']
+                current_weight = exercise['last_weight']
                 progress = current_weight - initial_weight
                 progress_color = ft.colors.GREEN if progress > 0 else ft.colors.RED
-                max_weight = max(d['weight'] for d in data)
+                max_weight = exercise['max_weight']
 
                 self.exercise_progress.controls.append(
                     ft.Card(
@@ -99,6 +119,8 @@ class ProgressTracking(Page):
                                 ft.Divider(),
                                 ft.Text(f"Current Weight: {current_weight} kg"),
                                 ft.Text(f"Personal Best: {max_weight} kg", color=ft.colors.BLUE),
+                                ft.Text(f"Best Estimated 1RM: {exercise['best_1rm']:.1f} kg"),
+                                ft.Text(f"Volume This Week vs Last: {exercise['weekly_tonnage_delta']:+.0f} kg"),
                                 ft.Text(
                                     f"Progress: {'+' if progress > 0 else ''}{progress:.1f} kg",
                                     color=progress_color
@@ -108,14 +130,19 @@ class ProgressTracking(Page):
                                     color=progress_color,
                                     bgcolor=ft.colors.GREY_300,
                                 ),
+                                self.build_line_chart(
+                                    self.exercise_series.get(exercise_name, ([], [])),
+                                    progress_color,
+                                ),
                             ]),
                             padding=20,
                         )
                     )
                 )
 
-    def on_date_range_change(self, e):
+    async def on_date_range_change(self, e):
         self.date_range = e.control.value
+        await self.load_workouts()
         self.process_workout_data()
         self.app.page.update()
 
@@ -0,0 +1,80 @@
+import asyncio
+import random
+from datetime import datetime
+import pytz
+
+from nutrisync_2.DateUtils import DAY_MS
+from nutrisync_2.RollupSystem import day_start_ms
+
+class QuoteDeck:
+    """Every motivational quote, held in memory and dealt out one per user per day.
+
+    The table is read once per process and shuffled, with quotes that were
+    displayed longest ago (or never) first. A user's quote for a day is a
+    fixed position in that deck: the day number plus an offset derived from
+    the user id, so each user gets a new quote every day, cycles through the
+    whole deck before repeating, and sees the same quote all day without
+    any per-user state. Users see different quotes on the same day.
+
+    Displayed dates are kept in memory and written back in one UPDATE per
+    batch through the connection manager's write-behind queue.
+    """
+
+    _quotes = None
+    _lock = None
+    _displayed = {}      # quote id: epoch ms of the day it was last displayed
+    _unsaved = set()     # quote ids whose displayed day hasn't been written yet
+
+    @classmethod
+    async def quote_for(cls, db, user_id, now=None):
+        """Today's quote for `user_id`, or None if there are no quotes."""
+        quotes = await cls._load(db)
+        if not quotes:
+            return None
+        day = day_start_ms(now or datetime.now(pytz.utc)) // DAY_MS
+        # A large prime multiplier spreads consecutive user ids over the deck
+        return quotes[(day + user_id * 7919) % len(quotes)]
+
+    @classmethod
+    def mark_displayed(cls, quote, write_behind, now=None):
+        """Record that `quote` was shown today; the write is batched with the others."""
+        day = day_start_ms(now or datetime.now(pytz.utc))
+        if cls._displayed.get(quote.id) == day:
+            return
+        cls._displayed[quote.id] = day
+        cls._unsaved.add(quote.id)
+        # One queued job at a time carries every quote marked before it runs
+        write_behind.submit(cls._save_displayed, key='quote-deck')
+
+    @classmethod
+    def forget(cls):
+        """Reload the quote table on next use, e.g. after quotes were added."""
+        cls._quotes = None
+
+    @classmethod
+    async def _load(cls, db):
+        if cls._quotes is not None:
+            return cls._quotes
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._quotes is None:
+                quotes = await db.motivationalquote.find_many()
+                random.shuffle(quotes)
+                # Stable sort keeps the shuffle within each group of equally old quotes
+                quotes.sort(key=lambda q: day_start_ms(q.dateDisplayed) if q.dateDisplayed else -1)
+                cls._quotes = quotes
+        return cls._quotes
+
+    @classmethod
+    async def _save_displayed(cls, db):
+        by_day = {}
+        for quote_id in cls._unsaved:
+            by_day.setdefault(cls._displayed[quote_id], []).append(quote_id)
+        for day, ids in by_day.items():
+            await db.execute_raw(
+                f'UPDATE "MotivationalQuote" SET "dateDisplayed" = ? WHERE "id" IN ({", ".join(["?"] * len(ids))})',
+                day,
+                *ids,
+            )
+            cls._unsaved.difference_update(ids)
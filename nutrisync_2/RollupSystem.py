@@ -0,0 +1,99 @@
+from datetime import datetime
+import pytz
+
+from nutrisync_2.DateUtils import DAY_MS, to_epoch_ms
+
+# Recomputes DailyRollup rows from Workout and Exercise; `?` pairs select one user or, with NULL, all users
+REBUILD_QUERY = f"""
+INSERT INTO "DailyRollup" ("userId", "day", "workouts", "minutes", "tonnage", "exercises", "updatedAt")
+SELECT
+    w."userId",
+    w."date" - w."date" % {DAY_MS},
+    COUNT(*),
+    SUM(w."duration"),
+    COALESCE(SUM(x."tonnage"), 0),
+    COALESCE(SUM(x."exercises"), 0),
+    ?
+FROM "Workout" w
+LEFT JOIN (
+    SELECT "workoutId", SUM("sets" * "reps" * COALESCE("weight", 0)) AS "tonnage", COUNT(*) AS "exercises"
+    FROM "Exercise"
+    GROUP BY "workoutId"
+) x ON x."workoutId" = w."id"
+WHERE ? IS NULL OR w."userId" = ?
+GROUP BY w."userId", w."date" - w."date" % {DAY_MS}
+"""
+
+RECORD_WORKOUT_QUERY = """
+INSERT INTO "DailyRollup" ("userId", "day", "workouts", "minutes", "tonnage", "exercises", "updatedAt")
+VALUES (?, ?, 1, ?, ?, ?, ?)
+ON CONFLICT ("userId", "day") DO UPDATE SET
+    "workouts" = "DailyRollup"."workouts" + 1,
+    "minutes" = "DailyRollup"."minutes" + excluded."minutes",
+    "tonnage" = "DailyRollup"."tonnage" + excluded."tonnage",
+    "exercises" = "DailyRollup"."exercises" + excluded."exercises",
+    "updatedAt" = excluded."updatedAt"
+"""
+
+def day_start_ms(dt):
+    """Epoch ms of midnight UTC on the day containing `dt`, the DailyRollup key."""
+    ms = to_epoch_ms(dt)
+    return ms - ms % DAY_MS
+
+class RollupSystem:
+    """Keeps the user's DailyRollup rows in step with saved workouts.
+
+    Like StatsSystem, it writes with the client it is given, so the save
+    path's transaction covers the rollup too. Readers get at most one row
+    per day instead of scanning Workout and Exercise.
+    """
+
+    def __init__(self, db, user_id):
+        self.db = db
+        self.user_id = user_id
+
+    async def record_workout(self, workout):
+        """Add a newly created workout (loaded with its exercises) to its day."""
+        exercises = workout.exercises or []
+        tonnage = sum(e.sets * e.reps * (e.weight or 0) for e in exercises)
+
+        await self.db.execute_raw(
+            RECORD_WORKOUT_QUERY,
+            self.user_id,
+            day_start_ms(workout.date),
+            workout.duration,
+            tonnage,
+            len(exercises),
+            to_epoch_ms(datetime.now(pytz.utc)),
+        )
+
+    async def workouts_since(self, since):
+        """Workouts logged on the day of `since` or later."""
+        row = await self.db.query_first(
+            'SELECT COALESCE(SUM("workouts"), 0) AS "workouts" FROM "DailyRollup" '
+            'WHERE "userId" = ? AND "day" >= ?',
+            self.user_id,
+            day_start_ms(since),
+        )
+        return int((row or {}).get('workouts') or 0)
+
+    async def rebuild(self):
+        """Recompute this user's rows from scratch, e.g. after workouts were deleted."""
+        await self.db.execute_raw('DELETE FROM "DailyRollup" WHERE "userId" = ?', self.user_id)
+        await self.db.execute_raw(
+            REBUILD_QUERY,
+            to_epoch_ms(datetime.now(pytz.utc)),
+            self.user_id,
+            self.user_id,
+        )
+
+    @staticmethod
+    async def rebuild_all(db):
+        """Recompute every user's rows. Returns the number of rows written."""
+        await db.execute_raw('DELETE FROM "DailyRollup"')
+        return await db.execute_raw(
+            REBUILD_QUERY,
+            to_epoch_ms(datetime.now(pytz.utc)),
+            None,
+            None,
+        )
@@ -0,0 +1,34 @@
+import time
+
+class StartupTimer:
+    """Elapsed-time marks from start to the first frame, printed as one report.
+
+    The process-wide timer created at import only records the import marks;
+    each session reports through its own timer from `session()`.
+    """
+
+    def __init__(self, started=None, marks=()):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = list(marks)
+        self.claimed = False
+
+    def session(self):
+        """A timer for one app session.
+
+        The first session continues from process start with the import marks,
+        so its report is the cold start; later sessions start from now.
+        """
+        if self.claimed:
+            return StartupTimer()
+        self.claimed = True
+        return StartupTimer(self.started, self.marks)
+
+    def mark(self, label):
+        self.marks.append((label, (time.perf_counter() - self.started) * 1000))
+
+    def report(self):
+        print("Startup timing (ms since start):")
+        previous = 0.0
+        for label, elapsed in self.marks:
+            print(f"  {label:<24}{elapsed:>9.1f}  (+{elapsed - previous:.1f})")
+            previous = elapsed
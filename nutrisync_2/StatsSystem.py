@@ -0,0 +1,129 @@
+from datetime import datetime
+import pytz
+
+from nutrisync_2.DateUtils import to_epoch_ms
+
+# Recomputes UserStats rows from raw data; `?` pairs select one user or, with NULL, all users
+REBUILD_QUERY = """
+INSERT OR REPLACE INTO "UserStats" (
+    "userId", "totalWorkouts", "totalMinutes", "distinctExercises", "longestDuration",
+    "currentStreak", "longestStreak", "lastWorkoutDate", "latestWeight", "updatedAt"
+)
+SELECT
+    u."id",
+    (SELECT COUNT(*) FROM "Workout" w WHERE w."userId" = u."id"),
+    (SELECT COALESCE(SUM(w."duration"), 0) FROM "Workout" w WHERE w."userId" = u."id"),
+    (SELECT COUNT(DISTINCT e."name") FROM "Exercise" e
+        JOIN "Workout" w ON w."id" = e."workoutId" WHERE w."userId" = u."id"),
+    (SELECT COALESCE(MAX(w."duration"), 0) FROM "Workout" w WHERE w."userId" = u."id"),
+    COALESCE((SELECT s."currentStreak" FROM "Streak" s WHERE s."userId" = u."id"
+        ORDER BY s."endDate" DESC LIMIT 1), 0),
+    COALESCE((SELECT MAX(s."longestStreak") FROM "Streak" s WHERE s."userId" = u."id"), 0),
+    (SELECT MAX(w."date") FROM "Workout" w WHERE w."userId" = u."id"),
+    u."weight",
+    ?
+FROM "User" u
+WHERE ? IS NULL OR u."id" = ?
+"""
+
+# Folds one new workout into the user's row; streak columns are copied from
+# the Streak table, which the save path has already updated
+RECORD_WORKOUT_QUERY = """
+INSERT INTO "UserStats" (
+    "userId", "totalWorkouts", "totalMinutes", "distinctExercises", "longestDuration",
+    "currentStreak", "longestStreak", "lastWorkoutDate", "updatedAt"
+)
+VALUES (
+    ?, 1, ?, ?, ?,
+    COALESCE((SELECT "currentStreak" FROM "Streak" WHERE "userId" = ?
+        ORDER BY "endDate" DESC LIMIT 1), 0),
+    COALESCE((SELECT MAX("longestStreak") FROM "Streak" WHERE "userId" = ?), 0),
+    ?, ?
+)
+ON CONFLICT ("userId") DO UPDATE SET
+    "totalWorkouts" = "UserStats"."totalWorkouts" + 1,
+    "totalMinutes" = "UserStats"."totalMinutes" + excluded."totalMinutes",
+    "distinctExercises" = "UserStats"."distinctExercises" + excluded."distinctExercises",
+    "longestDuration" = MAX("UserStats"."longestDuration", excluded."longestDuration"),
+    "currentStreak" = excluded."currentStreak",
+    "longestStreak" = MAX("UserStats"."longestStreak", excluded."longestStreak"),
+    "lastWorkoutDate" = MAX(COALESCE("UserStats"."lastWorkoutDate", 0), excluded."lastWorkoutDate"),
+    "updatedAt" = excluded."updatedAt"
+"""
+
+class StatsSystem:
+    """Keeps the UserStats row in step with writes.
+
+    Every method takes the client the caller is writing with, so passing
+    the transaction from `db.tx()` updates the stats in the same commit.
+    """
+
+    def __init__(self, db, user_id):
+        self.db = db
+        self.user_id = user_id
+
+    async def get(self):
+        """Single-row lookup of the user's stats, rebuilding the row if it is missing."""
+        stats = await self.db.userstats.find_unique(where={'userId': self.user_id})
+        if stats is None:
+            await self.rebuild()
+            stats = await self.db.userstats.find_unique(where={'userId': self.user_id})
+        return stats
+
+    async def record_workout(self, workout):
+        """Add a newly created workout (loaded with its exercises) to the stats."""
+        names = sorted({exercise.name for exercise in workout.exercises or []})
+        new_names = len(names)
+        if names:
+            # Names this user already logged before this workout don't count again
+            placeholders = ", ".join(["?"] * len(names))
+            seen = await self.db.query_first(
+                'SELECT COUNT(DISTINCT e."name") AS "seen" FROM "Exercise" e '
+                'JOIN "Workout" w ON w."id" = e."workoutId" '
+                f'WHERE w."userId" = ? AND w."id" != ? AND e."name" IN ({placeholders})',
+                self.user_id,
+                workout.id,
+                *names,
+            )
+            new_names -= int((seen or {}).get('seen') or 0)
+
+        await self.db.execute_raw(
+            RECORD_WORKOUT_QUERY,
+            self.user_id,
+            workout.duration,
+            new_names,
+            workout.duration,
+            self.user_id,
+            self.user_id,
+            to_epoch_ms(workout.date),
+            to_epoch_ms(datetime.now(pytz.utc)),
+        )
+
+    async def record_weight(self, weight):
+        await self.db.execute_raw(
+            'INSERT INTO "UserStats" ("userId", "latestWeight", "updatedAt") VALUES (?, ?, ?) '
+            'ON CONFLICT ("userId") DO UPDATE SET '
+            '"latestWeight" = excluded."latestWeight", "updatedAt" = excluded."updatedAt"',
+            self.user_id,
+            weight,
+            to_epoch_ms(datetime.now(pytz.utc)),
+        )
+
+    async def rebuild(self):
+        """Recompute this user's row from scratch, e.g. after workouts were deleted."""
+        await self.db.execute_raw(
+            REBUILD_QUERY,
+            to_epoch_ms(datetime.now(pytz.utc)),
+            self.user_id,
+            self.user_id,
+        )
+
+    @staticmethod
+    async def rebuild_all(db):
+        """Recompute every user's row. Returns the number of rows written."""
+        return await db.execute_raw(
+            REBUILD_QUERY,
+            to_epoch_ms(datetime.now(pytz.utc)),
+            None,
+            None,
+        )
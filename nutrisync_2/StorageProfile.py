@@ -0,0 +1,112 @@
+import math
+import os
+import re
+from pathlib import Path
+
+# schema.prisma's "file:./dev.db", resolved against the repository root
+DATABASE_PATH = Path(__file__).resolve().parent.parent / "dev.db"
+
+# Named sets of SQLite settings. "default" leaves SQLite's own defaults:
+# rollback journal, synchronous=FULL and a 2 MB page cache.
+PROFILES = {
+    "default": {},
+    "wal": {
+        "journal_mode": "WAL",            # readers and the writer no longer block each other
+        "synchronous": "NORMAL",          # fsync at checkpoints, not on every commit
+        "cache_size": -16000,             # negative means KiB: 16 MB per connection
+        "mmap_size": 134217728,           # read pages through a 128 MB memory map
+        "busy_timeout": 5000,             # ms to wait for a lock before failing
+        "wal_autocheckpoint": 1000,       # checkpoint once the WAL reaches this many pages
+        "journal_size_limit": 67108864,   # truncate the WAL back to 64 MB after a checkpoint
+    },
+}
+PROFILES["wal-durable"] = dict(PROFILES["wal"], synchronous="FULL")
+
+# Applied once: WAL mode is stored in the database file itself
+PERSISTENT_PRAGMAS = ["journal_mode"]
+# Passed in the datasource URL, so the engine sets them on every connection it opens
+URL_SETTINGS = ["connection_limit", "busy_timeout"]
+# Everything else only lasts for the connection it was set on, so with a pool it is best-effort
+CONNECTION_PRAGMAS = ["synchronous", "cache_size", "mmap_size", "wal_autocheckpoint", "journal_size_limit"]
+
+class StorageProfile:
+    """SQLite settings applied whenever ConnectionManager connects the engine.
+
+    The profile is picked with NUTRISYNC_STORAGE_PROFILE (default "wal")
+    and any single setting can be overridden with NUTRISYNC_SQLITE_<NAME>,
+    e.g. NUTRISYNC_SQLITE_SYNCHRONOUS=FULL. After connecting, the values
+    SQLite reports back are kept in `applied` and printed.
+
+    The engine keeps its own pool of connections, so pages go on reading
+    from the WAL while save_workout holds a connection for its transaction.
+    Only journal_mode, which is stored in the file, and busy_timeout, which
+    is passed in the URL, reach every connection. Prisma gives no way to run
+    a statement on each pooled connection, so the other pragmas are
+    best-effort: they hold on the connection `apply` ran on and the rest
+    keep SQLite's defaults, which are slower but never less durable.
+    `applied` is what one connection reports. Set
+    NUTRISYNC_SQLITE_CONNECTION_LIMIT=1 to trade the concurrent reads for
+    pragmas that are guaranteed to hold.
+
+    Checkpoints: SQLite checkpoints on its own once the WAL passes
+    `wal_autocheckpoint` pages, and `checkpoint()` truncates the WAL when
+    the last session closes so the file doesn't outlive the app.
+    """
+
+    def __init__(self, name, settings):
+        for key, value in settings.items():
+            if key not in PERSISTENT_PRAGMAS + URL_SETTINGS + CONNECTION_PRAGMAS:
+                raise ValueError(f"Unknown SQLite setting: {key}")
+            # Values end up in PRAGMA statements and the URL, so only plain words and numbers
+            if not re.fullmatch(r"-?\w+", str(value)):
+                raise ValueError(f"Invalid value for {key}: {value!r}")
+        self.name = name
+        self.settings = dict(settings)
+        self.applied = {}
+
+    @classmethod
+    def named(cls, name):
+        if name not in PROFILES:
+            raise ValueError(f"Unknown storage profile {name!r}, expected one of {', '.join(PROFILES)}")
+        return cls(name, PROFILES[name])
+
+    @classmethod
+    def from_env(cls):
+        profile = cls.named(os.environ.get("NUTRISYNC_STORAGE_PROFILE", "wal"))
+        for key in PERSISTENT_PRAGMAS + URL_SETTINGS + CONNECTION_PRAGMAS:
+            value = os.environ.get(f"NUTRISYNC_SQLITE_{key.upper()}")
+            if value is not None:
+                profile = cls(profile.name, dict(profile.settings, **{key: value}))
+        return profile
+
+    def datasource_url(self, path=DATABASE_PATH):
+        """The Prisma datasource URL for `path` with this profile's connection settings."""
+        params = []
+        if "connection_limit" in self.settings:
+            params.append(f"connection_limit={self.settings['connection_limit']}")
+        if "busy_timeout" in self.settings:
+            # Prisma calls SQLite's busy timeout socket_timeout and counts it in seconds
+            params.append(f"socket_timeout={math.ceil(int(self.settings['busy_timeout']) / 1000)}")
+        return f"file:{path}" + ("?" + "&".join(params) if params else "")
+
+    async def apply(self, db):
+        """Set the pragmas on a freshly connected client. Returns the values SQLite reports."""
+        for key in PERSISTENT_PRAGMAS + CONNECTION_PRAGMAS:
+            if key in self.settings:
+                await db.query_raw(f"PRAGMA {key} = {self.settings[key]}")
+
+        self.applied = {}
+        for key in PERSISTENT_PRAGMAS + ["busy_timeout"] + CONNECTION_PRAGMAS:
+            rows = await db.query_raw(f"PRAGMA {key}")
+            self.applied[key] = next(iter(rows[0].values())) if rows else None
+        print(f"SQLite storage profile '{self.name}': "
+              + ", ".join(f"{key}={value}" for key, value in self.applied.items()))
+        return self.applied
+
+    async def checkpoint(self, db):
+        """Copy the WAL into the database file and truncate it, e.g. before disconnecting."""
+        if str(self.settings.get("journal_mode", "")).upper() != "WAL":
+            return
+        rows = await db.query_raw("PRAGMA wal_checkpoint(TRUNCATE)")
+        if rows and rows[0].get("busy"):
+            print("WAL checkpoint could not finish; readers were still active")
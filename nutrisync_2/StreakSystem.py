@@ -0,0 +1,113 @@
+from nutrisync_2.DateUtils import DAY_MS, from_epoch_ms
+from nutrisync_2.RollupSystem import day_start_ms
+
+STREAK_INTERVAL_DAYS = 2  # a streak lapses when no workout is logged within this many days
+
+# Streak rows whose [start - interval, end + interval] window contains a day
+AFFECTED_STREAKS_QUERY = f"""
+SELECT "id", "startDate" + 0 AS "startDate", "endDate" + 0 AS "endDate", "currentStreak", "longestStreak"
+FROM "Streak"
+WHERE "userId" = ?
+    AND "startDate" - "startDate" % {DAY_MS} <= ?
+    AND "endDate" - "endDate" % {DAY_MS} >= ?
+ORDER BY "endDate"
+"""
+
+WORKOUT_DAYS_QUERY = f"""
+SELECT COUNT(DISTINCT "date" - "date" % {DAY_MS}) AS "days"
+FROM "Workout"
+WHERE "userId" = ? AND "date" >= ? AND "date" < ?
+"""
+
+def streak_cutoff_ms(now):
+    """Streaks whose last workout is before this epoch ms have lapsed by `now`."""
+    return day_start_ms(now) - STREAK_INTERVAL_DAYS * DAY_MS
+
+class StreakSystem:
+    """Keeps Streak rows in step with saved workouts, keyed on the workout's own date.
+
+    Each Streak row is one run of workout days no more than
+    STREAK_INTERVAL_DAYS apart; currentStreak counts its distinct days. A
+    workout on or after the latest run's last day costs one read and one
+    write. A backdated workout recounts only the runs it touches. Expiry is
+    not written anywhere; readers compare the last workout day with
+    `streak_cutoff_ms`.
+    """
+
+    def __init__(self, db, user_id):
+        self.db = db
+        self.user_id = user_id
+
+    async def record_workout(self, workout):
+        """Fold a newly created workout into the user's streaks."""
+        day = day_start_ms(workout.date)
+
+        latest = await self.db.streak.find_first(
+            where={'userId': self.user_id},
+            order={'endDate': 'desc'}
+        )
+
+        if latest is None:
+            await self._start_streak(workout.date, longest=1)
+            return
+
+        end_day = day_start_ms(latest.endDate)
+        if day < end_day:
+            await self._recount(workout.date)
+            return
+
+        gap_days = (day - end_day) // DAY_MS
+        if gap_days == 0:
+            return
+        if gap_days <= STREAK_INTERVAL_DAYS:
+            await self.db.streak.update(
+                where={'id': latest.id},
+                data={
+                    'endDate': workout.date,
+                    'currentStreak': latest.currentStreak + 1,
+                    'longestStreak': max(latest.longestStreak, latest.currentStreak + 1),
+                }
+            )
+        else:
+            await self._start_streak(workout.date, longest=max(latest.longestStreak, 1))
+
+    async def _start_streak(self, date, longest):
+        await self.db.streak.create(
+            data={
+                'startDate': date,
+                'endDate': date,
+                'currentStreak': 1,
+                'longestStreak': longest,
+                'userId': self.user_id,
+            }
+        )
+
+    async def _recount(self, date):
+        """Merge the runs a backdated workout touches and recount their days."""
+        day = day_start_ms(date)
+        window = STREAK_INTERVAL_DAYS * DAY_MS
+        streaks = await self.db.query_raw(AFFECTED_STREAKS_QUERY, self.user_id, day + window, day - window)
+
+        if not streaks:
+            await self._start_streak(date, longest=1)
+            return
+
+        start = min([day] + [day_start_ms(from_epoch_ms(s['startDate'])) for s in streaks])
+        end = max(day_start_ms(from_epoch_ms(s['endDate'])) for s in streaks)
+        row = await self.db.query_first(WORKOUT_DAYS_QUERY, self.user_id, start, end + DAY_MS)
+        days = int((row or {}).get('days') or 0)
+
+        # The newest run keeps its id and end date and absorbs the others
+        survivor = streaks[-1]
+        await self.db.streak.update(
+            where={'id': survivor['id']},
+            data={
+                'startDate': from_epoch_ms(start),
+                'currentStreak': days,
+                'longestStreak': max([days] + [s['longestStreak'] for s in streaks]),
+            }
+        )
+        if len(streaks) > 1:
+            await self.db.streak.delete_many(
+                where={'id': {'in': [s['id'] for s in streaks[:-1]]}}
+            )
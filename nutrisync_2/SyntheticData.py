@@ -0,0 +1,257 @@
+import random
+from datetime import datetime, timedelta
+import pytz
+
+from nutrisync_2.AchievementSystem import DURATION_MILESTONES, STREAK_MILESTONES, VARIETY_MILESTONES, WORKOUT_MILESTONES
+from nutrisync_2.DateUtils import DAY_MS, to_epoch_ms
+from nutrisync_2.GoalSystem import GoalType
+from nutrisync_2.StreakSystem import STREAK_INTERVAL_DAYS
+
+# The ExerciseOption rows every database starts with: (name, category)
+EXERCISE_CATALOG = [
+    ("Bench Press", "Chest"), ("Incline Bench Press", "Chest"), ("Decline Bench Press", "Chest"),
+    ("Dumbbell Press", "Chest"), ("Incline Dumbbell Press", "Chest"), ("Push-Ups", "Chest"),
+    ("Dips", "Chest"), ("Cable Flyes", "Chest"), ("Dumbbell Flyes", "Chest"),
+    ("Pull-Ups", "Back"), ("Lat Pulldowns", "Back"), ("Barbell Rows", "Back"),
+    ("Dumbbell Rows", "Back"), ("T-Bar Rows", "Back"), ("Face Pulls", "Back"),
+    ("Deadlift", "Back"), ("Cable Rows", "Back"),
+    ("Squats", "Legs"), ("Front Squats", "Legs"), ("Leg Press", "Legs"),
+    ("Romanian Deadlift", "Legs"), ("Leg Extensions", "Legs"), ("Leg Curls", "Legs"),
+    ("Calf Raises", "Legs"), ("Lunges", "Legs"), ("Bulgarian Split Squats", "Legs"),
+    ("Military Press", "Shoulders"), ("Overhead Press", "Shoulders"), ("Lateral Raises", "Shoulders"),
+    ("Front Raises", "Shoulders"), ("Reverse Flyes", "Shoulders"), ("Upright Rows", "Shoulders"),
+    ("Arnold Press", "Shoulders"), ("Shrugs", "Shoulders"),
+    ("Bicep Curls", "Arms"), ("Hammer Curls", "Arms"), ("Preacher Curls", "Arms"),
+    ("Tricep Extensions", "Arms"), ("Tricep Pushdowns", "Arms"), ("Skull Crushers", "Arms"),
+    ("Concentration Curls", "Arms"), ("Diamond Push-Ups", "Arms"),
+    ("Crunches", "Core"), ("Planks", "Core"), ("Russian Twists", "Core"),
+    ("Leg Raises", "Core"), ("Ab Wheel Rollouts", "Core"), ("Mountain Climbers", "Core"),
+    ("Hanging Leg Raises", "Core"), ("Wood Choppers", "Core"),
+    ("Treadmill Running", "Cardio"), ("Cycling", "Cardio"), ("Jump Rope", "Cardio"),
+    ("Rowing", "Cardio"), ("Stair Climber", "Cardio"), ("Elliptical", "Cardio"),
+    ("Burpees", "Cardio"), ("High Knees", "Cardio"),
+    ("Clean and Press", "Compound"), ("Power Clean", "Compound"), ("Turkish Get-Up", "Compound"),
+    ("Kettlebell Swings", "Compound"), ("Thrusters", "Compound"), ("Man Makers", "Compound"),
+]
+
+# Starting working weight range in kg by category; None means bodyweight or cardio
+STARTING_WEIGHTS = {
+    "Chest": (30, 90), "Back": (30, 120), "Legs": (40, 140), "Shoulders": (15, 60),
+    "Arms": (8, 35), "Compound": (20, 60), "Core": None, "Cardio": None,
+}
+BODYWEIGHT_EXERCISES = {"Push-Ups", "Dips", "Pull-Ups", "Diamond Push-Ups", "Lunges", "Burpees"}
+
+WORKOUT_TYPES = ["Strength", "Cardio", "Flexibility", "HIIT", "Other"]
+DURATIONS = [30, 45, 60, 75, 90, 120]
+FIRST_NAMES = [
+    "Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn",
+    "Maria", "Wei", "Aisha", "Lucas", "Priya", "Noah", "Elena", "Kenji", "Fatima", "Oliver",
+]
+USER_GOALS = {"Weight Loss": -0.3, "Muscle Gain": 0.15, "Maintenance": 0.0}  # kg per week
+
+# Column lists in the order rows are generated; tables are listed parents first
+COLUMNS = {
+    "User": ("id", "email", "password", "name", "height", "weight", "age", "gender", "goal", "createdAt", "updatedAt"),
+    "Workout": ("id", "date", "duration", "type", "notes", "userId"),
+    "Exercise": ("name", "sets", "reps", "weight", "workoutId"),
+    "WeightHistory": ("weight", "date", "userId"),
+    "Streak": ("startDate", "endDate", "currentStreak", "longestStreak", "userId"),
+    "Goal": ("title", "description", "goalType", "targetValue", "currentValue", "startDate",
+             "targetDate", "completed", "exerciseName", "userId"),
+    "Achievement": ("title", "description", "dateEarned", "userId"),
+}
+
+def round_to_plate(weight):
+    """Round to the nearest 2.5 kg, the smallest jump most gyms can load."""
+    return round(weight / 2.5) * 2.5
+
+class SyntheticData:
+    """Reproducible fake users with a plausible training history.
+
+    Each user trains a few times a week on a favourite set of exercises,
+    lifts a little more as the months go by, and logs body weight weekly
+    drifting towards their goal. Streaks, goals and achievements are
+    derived from the generated workouts with the same rules the app uses,
+    so the rows look like ones the app wrote itself. The same seed gives
+    the same rows relative to `now`.
+    """
+
+    def __init__(self, seed=42, now=None, days=730, password="x"):
+        self.rng = random.Random(seed)
+        self.now = now or datetime.now(pytz.utc)
+        self.days = days
+        self.password = password
+
+    def tables(self, users, workouts_per_user, exercises_per_workout=3, first_user_id=1, first_workout_id=1):
+        """Rows for every table, keyed by table name in insert order.
+
+        Ids are assigned from `first_user_id` and `first_workout_id` so the
+        rows can be appended to a database that already has data.
+        """
+        rows = {table: [] for table in COLUMNS}
+        workout_id = first_workout_id
+        for user_id in range(first_user_id, first_user_id + users):
+            self._add_user(rows, user_id, workout_id, workouts_per_user, exercises_per_workout)
+            workout_id += workouts_per_user
+        return rows
+
+    def _add_user(self, rows, user_id, first_workout_id, workout_count, exercises_per_workout):
+        rng = self.rng
+        gender = rng.choice(["Male", "Female"])
+        height = round(rng.gauss(178 if gender == "Male" else 165, 7), 1)
+        start_weight = round(rng.gauss(82 if gender == "Male" else 66, 10), 1)
+        goal = rng.choice(list(USER_GOALS))
+        per_week = rng.choice([1, 2, 3, 3, 3, 4, 4, 5, 6])
+        favourites = rng.sample(
+            [entry for entry in EXERCISE_CATALOG if entry[1] != "Cardio"], rng.randint(6, 12)
+        )
+        cardio = [entry for entry in EXERCISE_CATALOG if entry[1] == "Cardio"]
+        type_weights = [rng.randint(5, 10), rng.randint(0, 4), rng.randint(0, 2), rng.randint(0, 3), 1]
+        usual_duration = rng.choice(DURATIONS[:4])
+
+        dates = self._workout_dates(workout_count, per_week)
+        first_ms = to_epoch_ms(dates[0]) if dates else to_epoch_ms(self.now)
+        span_ms = max(to_epoch_ms(self.now) - first_ms, DAY_MS)
+        starting = {name: self._starting_weight(name, category) for name, category in favourites}
+
+        seen_exercises = set()
+        best_weights = {}
+        milestones = {}  # title: (date, description), first time it was reached
+        for offset, date in enumerate(dates):
+            workout_id = first_workout_id + offset
+            date_ms = to_epoch_ms(date)
+            workout_type = rng.choices(WORKOUT_TYPES, type_weights)[0]
+            target = rng.gauss(usual_duration, 15)
+            duration = min(DURATIONS, key=lambda d: abs(d - target))
+            rows["Workout"].append((workout_id, date_ms, duration, workout_type, "", user_id))
+
+            # Progressive overload: up to ~30% heavier by the end of the history
+            progress = 1 + 0.3 * (date_ms - first_ms) / span_ms
+            pool = cardio if workout_type == "Cardio" else favourites
+            picks = rng.sample(pool, min(exercises_per_workout, len(pool)))
+            picks += [rng.choice(pool) for _ in range(exercises_per_workout - len(picks))]
+            for name, category in picks:
+                if category == "Cardio":
+                    sets, reps, weight = 1, rng.choice([10, 15, 20, 30]), None
+                else:
+                    sets, reps = rng.randint(3, 5), rng.choice([5, 6, 8, 10, 12])
+                    base = starting[name]
+                    weight = round_to_plate(base * progress * rng.uniform(0.92, 1.05)) if base else None
+                if weight:
+                    best_weights[name] = max(best_weights.get(name, 0), weight)
+                rows["Exercise"].append((name, sets, reps, weight, workout_id))
+
+                if name not in seen_exercises:
+                    seen_exercises.add(name)
+                    count = len(seen_exercises)
+                    if count in VARIETY_MILESTONES:
+                        milestones.setdefault(VARIETY_MILESTONES[count], (date, f"Performed {count} different exercises!"))
+
+            if offset + 1 in WORKOUT_MILESTONES:
+                milestones.setdefault(WORKOUT_MILESTONES[offset + 1], (date, f"Completed {offset + 1} workouts!"))
+            for minutes, title in DURATION_MILESTONES.items():
+                if duration >= minutes:
+                    milestones.setdefault(title, (date, f"Completed a {minutes}-minute workout!"))
+
+        for date, title, description in self._add_streaks(rows, user_id, dates):
+            milestones.setdefault(title, (date, description))
+
+        weight = self._add_weight_history(rows, user_id, dates, start_weight, USER_GOALS[goal])
+        created = (dates[0] if dates else self.now) - timedelta(days=rng.randint(0, 14))
+        rows["User"].append((
+            user_id, f"user{user_id}@example.com", self.password,
+            f"{rng.choice(FIRST_NAMES)} {user_id}", height, weight, rng.randint(18, 65), gender, goal,
+            to_epoch_ms(created), to_epoch_ms(self.now),
+        ))
+
+        self._add_goals(rows, user_id, created, start_weight, weight, goal, len(dates), best_weights)
+
+        for title, (date, description) in sorted(milestones.items(), key=lambda item: item[1][0]):
+            rows["Achievement"].append((title, description, to_epoch_ms(date), user_id))
+
+    def _workout_dates(self, count, per_week):
+        """`count` workout times ending near now, about `per_week` a week, oldest first."""
+        rng = self.rng
+        # Some users have stopped training for a while
+        day = rng.choice([0, 0, 0, 1, 2, 5, 14, 45])
+        # Train more often than usual rather than run past `days` of history
+        mean_gap = min(7 / per_week, (self.days - day) / max(count, 1))
+        dates = []
+        for _ in range(count):
+            date = self.now - timedelta(days=min(day, self.days - 1))
+            dates.append(date.replace(
+                hour=rng.choice([6, 7, 8, 12, 17, 18, 19, 20]), minute=rng.randrange(60), second=0, microsecond=0,
+            ))
+            day += max(0, round(rng.gauss(mean_gap, mean_gap / 3)))
+        # Trimming the time of day can push today's workout past now
+        return sorted(min(date, self.now) for date in dates)
+
+    def _starting_weight(self, name, category):
+        limits = STARTING_WEIGHTS.get(category)
+        if limits is None or name in BODYWEIGHT_EXERCISES:
+            return None
+        return self.rng.uniform(*limits)
+
+    def _add_streaks(self, rows, user_id, dates):
+        """Streak rows the way StreakSystem builds them; returns streak milestones."""
+        milestones = []
+        longest = 0
+        run_start = run_end = None
+        run_days = 0
+        last_day = None
+        for date in dates:
+            day = to_epoch_ms(date) // DAY_MS
+            if last_day is not None and day == last_day:
+                run_end = date
+                continue
+            if last_day is None or day - last_day > STREAK_INTERVAL_DAYS:
+                if run_start is not None:
+                    rows["Streak"].append((to_epoch_ms(run_start), to_epoch_ms(run_end), run_days, longest, user_id))
+                run_start, run_days = date, 0
+            run_end = date
+            run_days += 1
+            longest = max(longest, run_days)
+            last_day = day
+            if run_days in STREAK_MILESTONES:
+                milestones.append((date, STREAK_MILESTONES[run_days], f"Maintained a {run_days}-day workout streak!"))
+        if run_start is not None:
+            rows["Streak"].append((to_epoch_ms(run_start), to_epoch_ms(run_end), run_days, longest, user_id))
+        return milestones
+
+    def _add_weight_history(self, rows, user_id, dates, start_weight, weekly_change):
+        """Weekly weigh-ins from the first workout to now; returns the latest weight."""
+        rng = self.rng
+        weeks = min(104, max(1, ((self.now - dates[0]).days // 7) if dates else 1))
+        weight = start_weight
+        for week in range(weeks, -1, -1):
+            weight = round(start_weight + weekly_change * (weeks - week) + rng.gauss(0, 0.6), 1)
+            rows["WeightHistory"].append((weight, to_epoch_ms(self.now - timedelta(days=7 * week)), user_id))
+        return weight
+
+    def _add_goals(self, rows, user_id, created, start_weight, weight, goal, workouts, best_weights):
+        rng = self.rng
+        start_ms = to_epoch_ms(created)
+        target_ms = to_epoch_ms(self.now + timedelta(days=rng.randint(30, 180)))
+
+        if goal != "Maintenance":
+            target = round(start_weight + (-5 if goal == "Weight Loss" else 5), 1)
+            done = weight <= target if goal == "Weight Loss" else weight >= target
+            rows["Goal"].append((
+                f"Reach {target} kg", goal, GoalType.TARGET_WEIGHT, target, weight,
+                start_ms, target_ms, int(done), None, user_id,
+            ))
+
+        target = rng.choice([25, 50, 100, 200])
+        rows["Goal"].append((
+            f"Log {target} workouts", None, GoalType.WORKOUT_COUNT, float(target), float(min(workouts, target)),
+            start_ms, target_ms, int(workouts >= target), None, user_id,
+        ))
+
+        if best_weights:
+            name = rng.choice(sorted(best_weights))
+            best = best_weights[name]
+            target = round_to_plate(best * rng.uniform(0.9, 1.2))
+            rows["Goal"].append((
+                f"{name} {target} kg", None, GoalType.EXERCISE_WEIGHT, target, best,
+                start_ms, target_ms, int(best >= target), name, user_id,
+            ))
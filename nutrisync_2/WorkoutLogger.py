@@ -2,6 +2,12 @@ import flet as ft
 from datetime import datetime
 from nutrisync_2.Page import Page
 from nutrisync_2.AchievementSystem import AchievementSystem
+from nutrisync_2.ExerciseCatalog import ExerciseCatalog
+from nutrisync_2.ExerciseSearch import ExerciseSearch
+from nutrisync_2.ProgressSeries import ProgressSeries
+from nutrisync_2.StatsSystem import StatsSystem
+from nutrisync_2.RollupSystem import RollupSystem
+from nutrisync_2.StreakSystem import StreakSystem
 import pytz
 
 class FocusedTextField(ft.TextField):
@@ -16,21 +22,31 @@ class WorkoutLogger(Page):
     def __init__(self, app, name, route):
         super().__init__(app, name, route)
         self.exercise_options = []
+        self.catalog_version = None
         self.exercise_list = ft.Column(spacing=10)
         self.init_components()
     
     async def load_exercise_options(self):
-        if not self.exercise_options:
-            if not self.app.db.is_connected():
-                await self.app.db.connect()
-            
-            options = await self.app.db.exerciseoption.find_many(
-                order={"name": "asc"}
-            )
-            self.exercise_options = [option.name for option in options]
-            self.exercise_options.append("Other")
-            await self.app.db.disconnect()
-            self.exercise_dropdown.options = [ft.dropdown.Option(ex) for ex in self.exercise_options]
+        if not ExerciseCatalog.loaded():
+            async with self.app.db_manager.connection() as db:
+                await ExerciseCatalog.load(db)
+        # Rebuild the dropdown only when the shared catalog has changed
+        if self.catalog_version != ExerciseCatalog.version:
+            self.catalog_version = ExerciseCatalog.version
+            self.show_exercise_matches(self.exercise_search.value)
+            self.app.page.update()
+
+    def show_exercise_matches(self, query):
+        # The dropdown only ever holds the best matches, not the whole catalog
+        matches = ExerciseSearch.shared().top_k(query or "")
+        self.exercise_options = matches + ["Other"]
+        self.exercise_dropdown.options = [ft.dropdown.Option(ex) for ex in self.exercise_options]
+        if query and matches and self.exercise_dropdown.value not in matches:
+            self.exercise_dropdown.value = matches[0]
+            self.custom_exercise_input.visible = False
+
+    def on_exercise_search(self, e):
+        self.show_exercise_matches(e.control.value)
         self.app.page.update()
 
 
@@ -68,6 +84,11 @@ class WorkoutLogger(Page):
             keyboard_type=ft.KeyboardType.NUMBER,
         )
 
+        self.exercise_search = ft.TextField(
+            label="Search Exercises",
+            width=200,
+            on_change=self.on_exercise_search,
+        )
         self.exercise_dropdown = ft.Dropdown(
             label="Exercise",
             options=[],  # Will be populated in load_exercise_options
@@ -105,6 +126,10 @@ class WorkoutLogger(Page):
         await self.load_exercise_options()
 
 
+    async def refresh(self):
+        # The form carries over between visits; pick up exercise names added since
+        await self.load_exercise_options()
+
     def build(self):
         add_exercise_button = ft.ElevatedButton(
             "Add Exercise",
@@ -125,6 +150,7 @@ class WorkoutLogger(Page):
             self.duration_input,
             ft.Text("Add Exercises", size=18, weight=ft.FontWeight.BOLD),
             ft.Row([
+                self.exercise_search,
                 self.exercise_dropdown,
                 add_exercise_button,
             ]),
@@ -155,7 +181,9 @@ class WorkoutLogger(Page):
         self.exercise_list.controls.append(exercise_item)
         
         # Clear inputs
+        self.exercise_search.value = ""
         self.exercise_dropdown.value = None
+        self.show_exercise_matches("")
         self.custom_exercise_input.value = ""
         self.sets_input.value = ""
         self.reps_input.value = ""
@@ -205,67 +233,83 @@ class WorkoutLogger(Page):
         self.date_picker.pick_date()
 
     async def save_workout(self, _):
-        if not self.app.db.is_connected(): await self.app.db.connect()
         workout_data = self.get_workout_data()
         if not all([self.workout_type_dropdown.value]):
             print("Invalid Exercise Type")
             return
+
+        # Validate everything before opening the transaction
         try:
             workout_date = datetime.strptime(workout_data["date"], "%Y-%m-%d")
-            rfc3339_date = self.to_rfc3339(workout_date)
-
-            new_workout = await self.app.db.workout.create(
-                data={
-                    "date": rfc3339_date,
-                    "duration": int(workout_data["duration"]),
-                    "type": workout_data["workout_type"],
-                    "notes": workout_data["notes"],
-                    "userId": self.app.current_user_id,
+            duration = int(workout_data["duration"])
+            exercises = [
+                {
+                    "name": exercise["exercise_name"],
+                    "sets": int(exercise["sets"]),
+                    "reps": int(exercise["reps"]),
+                    "weight": float(exercise["weight"]) if exercise["weight"] else None,
                 }
+                for exercise in workout_data["exercises"]
+            ]
+        except ValueError:
+            self.app.page.show_snack_bar(
+                ft.SnackBar(content=ft.Text("Please enter valid numbers for duration, sets, reps and weight"))
             )
+            return
 
-            for exercise in workout_data["exercises"]:
-                existing_exercise = await self.app.db.exerciseoption.find_first(
-                    where={"name": exercise["exercise_name"]}
-                )
-                if not existing_exercise:
-                    await self.app.db.exerciseoption.create(
-                        data={"name": exercise["exercise_name"]}
+        try:
+            async with self.app.db_manager.connection() as db:
+                # insert_missing needs the catalog; load it before the transaction holds a connection
+                await ExerciseCatalog.load(db)
+                # Workout, exercises, new exercise names, streak, stats and rollup commit together or not at all
+                async with db.tx() as tx:
+                    new_names = await ExerciseCatalog.insert_missing(tx, {exercise["name"] for exercise in exercises})
+
+                    new_workout = await tx.workout.create(
+                        data={
+                            "date": self.to_rfc3339(workout_date),
+                            "duration": duration,
+                            "type": workout_data["workout_type"],
+                            "notes": workout_data["notes"],
+                            "userId": self.app.current_user_id,
+                            "exercises": {"create": exercises},
+                        },
+                        include={"exercises": True},
                     )
+                    await StreakSystem(tx, self.app.current_user_id).record_workout(new_workout)
+                    await StatsSystem(tx, self.app.current_user_id).record_workout(new_workout)
+                    await RollupSystem(tx, self.app.current_user_id).record_workout(new_workout)
 
-                await self.app.db.exercise.create(
-                    data={
-                        "name": exercise["exercise_name"],
-                        "sets": int(exercise["sets"]),
-                        "reps": int(exercise["reps"]),
-                        "weight": float(exercise["weight"]) if exercise["weight"] else None,
-                        "workoutId": new_workout.id,
-                    }
-                )
-
-            print(f"Workout saved successfully with ID: {new_workout.id}")
-            await self.update_user_streak()
-            
-            # Check for achievements
-            achievement_system = AchievementSystem(self.app.db, self.app.current_user_id)
-            new_achievements = await achievement_system.check_achievements()
-            
-            # Show achievement notifications
-            if new_achievements:
-                achievements_text = "\n".join([f"🏆 {a.title}" for a in new_achievements])
-                self.app.page.show_snack_bar(
-                    ft.SnackBar(
-                        content=ft.Text(f"New achievements earned!\n{achievements_text}"),
-                        duration=5000
-                    )
-                )
-            
-            self.clear_form()
-            self.app.page.update()
+                ExerciseCatalog.add(new_names)
+                print(f"Workout saved successfully with ID: {new_workout.id}")
+                ProgressSeries.forget(self.app.current_user_id)
         except Exception as e:
             print(f"Error saving workout: {str(e)}")
-        finally:
-            await self.app.db.disconnect()
+            self.app.page.show_snack_bar(
+                ft.SnackBar(content=ft.Text(f"Workout was not saved: {str(e)}"))
+            )
+            return
+
+        # Achievements are awarded after the form is cleared and announced when ready
+        user_id = self.app.current_user_id
+        self.app.db_manager.write_behind.submit(
+            lambda db: AchievementSystem(db, user_id).check_achievements(),
+            on_done=self.announce_achievements,
+        )
+
+        self.app.page.show_snack_bar(
+            ft.SnackBar(content=ft.Text("Workout saved!"), duration=5000)
+        )
+
+        self.clear_form()
+
+    async def announce_achievements(self, new_achievements):
+        if not new_achievements:
+            return
+        achievements_text = "\n".join([f"🏆 {a.title}" for a in new_achievements])
+        self.app.page.show_snack_bar(
+            ft.SnackBar(content=ft.Text(f"New achievements earned!\n{achievements_text}"), duration=5000)
+        )
 
     def parse_exercise_item(self, item_text):
         parts = item_text.split(" - ")
@@ -283,62 +327,6 @@ class WorkoutLogger(Page):
 
 
 
-    async def update_user_streak(self):
-        STREAK_INTERVAL_DAYS = 2  # Configure workout interval here
-        # Streak will be reset if no new workout is logged within above set limit
-        
-        today = datetime.now(pytz.utc)
-        user_id = self.app.current_user_id
-
-        current_streak = await self.app.db.streak.find_first(
-            where={"userId": user_id},
-            order={"endDate": "desc"}
-        )
-
-        if current_streak:
-            current_end_date = current_streak.endDate.date() if isinstance(current_streak.endDate, datetime) else current_streak.endDate
-            days_since_last = (today.date() - current_end_date).days
-
-            # Continue streak if within acceptable interval (1-2 days)
-            if 1 <= days_since_last <= STREAK_INTERVAL_DAYS:
-                await self.app.db.streak.update(
-                    where={"id": current_streak.id},
-                    data={
-                        "endDate": today,
-                        "currentStreak": current_streak.currentStreak + 1
-                    }
-                )
-                
-                # Update longest streak if applicable
-                if current_streak.currentStreak + 1 > current_streak.longestStreak:
-                    await self.app.db.streak.update(
-                        where={"id": current_streak.id},
-                        data={"longestStreak": current_streak.currentStreak + 1}
-                    )
-            
-            # Start new streak if too much time has passed
-            elif days_since_last > STREAK_INTERVAL_DAYS:
-                await self.app.db.streak.create(
-                    data={
-                        "startDate": today,
-                        "endDate": today,
-                        "currentStreak": 1,
-                        "longestStreak": max(current_streak.longestStreak, 1),
-                        "userId": user_id
-                    }
-                )
-        else:
-            # First streak for the user
-            await self.app.db.streak.create(
-                data={
-                    "startDate": today,
-                    "endDate": today,
-                    "currentStreak": 1,
-                    "longestStreak": 1,
-                    "userId": user_id
-                }
-            )
-
     def get_workout_data(self):
         exercises = []
         for exercise_item in self.exercise_list.controls:
@@ -359,7 +347,9 @@ class WorkoutLogger(Page):
         self.date_text.value = datetime.now().strftime("%Y-%m-%d")  # Updated to use date_text
         self.workout_type_dropdown.value = None
         self.duration_input.value = "60"
+        self.exercise_search.value = ""
         self.exercise_dropdown.value = None
+        self.show_exercise_matches("")
         self.custom_exercise_input.value = ""
         self.sets_input.value = ""
         self.reps_input.value = ""
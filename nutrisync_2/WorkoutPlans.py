@@ -1,5 +1,6 @@
 import flet as ft
 from nutrisync_2.Page import Page
+from nutrisync_2.ExerciseCatalog import ExerciseCatalog
 from typing import List, Dict
 
 class WorkoutPlans(Page):
@@ -14,31 +15,23 @@ class WorkoutPlans(Page):
         self.is_creating_plan = False
 
     async def load_exercise_options(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        options = await self.app.db.exerciseoption.find_many(
-            order={"name": "asc"}
-        )
-        self.exercise_options = [option.name for option in options]
-        self.exercise_options.append("Other")
-        await self.app.db.disconnect()
+        if not ExerciseCatalog.loaded():
+            async with self.app.db_manager.connection() as db:
+                await ExerciseCatalog.load(db)
+        self.exercise_options = ExerciseCatalog.names() + ["Other"]
 
     async def load_plans(self):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-        
-        plans = await self.app.db.workoutplan.find_many(
-            where={"userId": self.app.current_user_id},
-            include={"exercises": True}
-        )
+        async with self.app.db_manager.connection() as db:
+            plans = await db.workoutplan.find_many(
+                where={"userId": self.app.current_user_id},
+                include={"exercises": True}
+            )
         
         self.plans_list.controls.clear()
         for plan in plans:
             plan_card = self.create_plan_card(plan.name, plan.description, plan.id)
             self.plans_list.controls.append(plan_card)
         
-        await self.app.db.disconnect()
         self.app.page.update()
 
     def build(self):
@@ -157,30 +150,28 @@ class WorkoutPlans(Page):
             self.app.page.show_snack_bar(ft.SnackBar(content=ft.Text("Please add at least one exercise")))
             return
 
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-
         try:
-            new_plan = await self.app.db.workoutplan.create(
-                data={
-                    "name": self.plan_name_input.value,
-                    "description": self.plan_description_input.value,
-                    "userId": self.app.current_user_id,
-                    "exercises": {
-                        "create": [
-                            {
-                                "name": exercise["custom_name"].value if exercise["name"].value == "Other" else exercise["name"].value,
-                                "sets": int(exercise["sets"].value),
-                                "reps": int(exercise["reps"].value),
-                                "weight": float(exercise["weight"].value) if exercise["weight"].value else None
-                            }
-                            for exercise in self.exercise_inputs
-                            if (exercise["name"].value == "Other" and exercise["custom_name"].value) or (exercise["name"].value != "Other" and exercise["name"].value)
-                            and exercise["sets"].value and exercise["reps"].value
-                        ]
+            async with self.app.db_manager.connection() as db:
+                new_plan = await db.workoutplan.create(
+                    data={
+                        "name": self.plan_name_input.value,
+                        "description": self.plan_description_input.value,
+                        "userId": self.app.current_user_id,
+                        "exercises": {
+                            "create": [
+                                {
+                                    "name": exercise["custom_name"].value if exercise["name"].value == "Other" else exercise["name"].value,
+                                    "sets": int(exercise["sets"].value),
+                                    "reps": int(exercise["reps"].value),
+                                    "weight": float(exercise["weight"].value) if exercise["weight"].value else None
+                                }
+                                for exercise in self.exercise_inputs
+                                if (exercise["name"].value == "Other" and exercise["custom_name"].value) or (exercise["name"].value != "Other" and exercise["name"].value)
+                                and exercise["sets"].value and exercise["reps"].value
+                            ]
+                        }
                     }
-                }
-            )
+                )
             print(f"Workout plan created with ID: {new_plan.id}")
             await self.load_plans()
             self.return_to_plans_list(None)
@@ -188,8 +179,6 @@ class WorkoutPlans(Page):
         except Exception as e:
             print(f"Error creating workout plan: {str(e)}")
             self.app.page.show_snack_bar(ft.SnackBar(content=ft.Text("Error creating workout plan")))
-        finally:
-            await self.app.db.disconnect()
 
     def create_plan_card(self, name, description, plan_id):
         return ft.Card(
@@ -212,27 +201,21 @@ class WorkoutPlans(Page):
         pass
 
     async def delete_plan(self, plan_id):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-
         try:
-            await self.app.db.workoutplan.delete(where={"id": plan_id})
+            async with self.app.db_manager.connection() as db:
+                await db.workoutplan.delete(where={"id": plan_id})
             print(f"Workout plan deleted with ID: {plan_id}")
             await self.load_plans()
         except Exception as e:
             print(f"Error deleting workout plan: {str(e)}")
-        finally:
-            await self.app.db.disconnect()
 
     async def use_plan(self, plan_id):
-        if not self.app.db.is_connected():
-            await self.app.db.connect()
-
         try:
-            plan = await self.app.db.workoutplan.find_first(
-                where={"id": plan_id},
-                include={"exercises": True}
-            )
+            async with self.app.db_manager.connection() as db:
+                plan = await db.workoutplan.find_first(
+                    where={"id": plan_id},
+                    include={"exercises": True}
+                )
             if plan:
                 # Navigate to WorkoutLogger and pass the plan data
                 await self.app.navigate("/log-workout", plan_data=plan)
@@ -240,8 +223,6 @@ class WorkoutPlans(Page):
                 print(f"Workout plan not found with ID: {plan_id}")
         except Exception as e:
             print(f"Error loading workout plan: {str(e)}")
-        finally:
-            await self.app.db.disconnect()
 
     async def before_build(self):
         await self.load_exercise_options()
@@ -0,0 +1,116 @@
+import asyncio
+from collections import OrderedDict
+from itertools import count
+
+BATCH_SIZE = 20        # jobs run per borrowed connection
+BATCH_DELAY = 0.05     # seconds to let more jobs arrive before a batch runs
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 0.5      # seconds, doubled after each failed attempt
+
+class WriteBehind:
+    """Runs writes the UI does not need to wait for, after the page has moved on.
+
+    `submit(job)` queues an async `job(db)` and returns at once. A single
+    worker task drains the queue in batches, borrowing one connection from
+    the ConnectionManager per batch. When a job fails the rest of its batch
+    goes back to the front of the queue, and the job itself is retried with
+    a growing delay until MAX_ATTEMPTS. Jobs submitted with the same `key`
+    while one is still queued replace it, so repeated writes of the same
+    row collapse into one. `flush()` waits for everything queued so far;
+    the manager runs
+    them all with `close()` before shutting the engine down.
+
+    Only side writes belong here: nothing a later read on the same screen
+    depends on, since a queued job may not have run yet.
+    """
+
+    def __init__(self, manager, batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+        self.manager = manager
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._pending = OrderedDict()  # key: (job, on_done, attempts)
+        self._ids = count()
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._worker = None
+
+    def submit(self, job, on_done=None, key=None):
+        """Queue `job(db)`; `on_done(result)` is awaited after it succeeds."""
+        if key is None:
+            key = next(self._ids)
+        else:
+            # Keep the replaced job's place in the queue
+            self._pending.pop(key, None)
+        self._pending[key] = (job, on_done, 0)
+        self._drained.clear()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def flush(self):
+        """Wait until every job submitted so far has run or been given up on."""
+        if self._worker is not None and not self._worker.done():
+            await self._drained.wait()
+
+    async def close(self):
+        """Flush, then stop the worker; the next submit starts a new one."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                self._drained.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            await asyncio.sleep(BATCH_DELAY)
+            batch = []
+            while self._pending and len(batch) < self.batch_size:
+                key, (job, on_done, attempts) = self._pending.popitem(last=False)
+                batch.append((key, job, on_done, attempts))
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch):
+        finished = []
+        error = None
+        try:
+            async with self.manager.connection() as db:
+                for key, job, on_done, attempts in batch:
+                    finished.append((on_done, await job(db)))
+        except Exception as e:
+            # Leaving the connection block lets the manager notice a dead engine
+            error = e
+
+        # Callbacks run after the connection is back in the pool
+        for on_done, result in finished:
+            if on_done is not None:
+                try:
+                    await on_done(result)
+                except Exception as e:
+                    print(f"Error after queued write: {str(e)}")
+
+        if error is not None:
+            await self._retry(batch[len(finished):], error)
+
+    async def _retry(self, unfinished, error):
+        (key, job, on_done, attempts), rest = unfinished[0], unfinished[1:]
+        attempts += 1
+        if attempts >= self.max_attempts:
+            print(f"Giving up on queued write after {attempts} attempts: {str(error)}")
+            requeue, delay = rest, 0
+        else:
+            print(f"Queued write failed, retrying: {str(error)}")
+            requeue, delay = [(key, job, on_done, attempts)] + rest, RETRY_DELAY * 2 ** (attempts - 1)
+
+        for entry in reversed(requeue):
+            # A newer job for the same key supersedes the one being retried
+            if entry[0] not in self._pending:
+                self._pending[entry[0]] = entry[1:]
+                self._pending.move_to_end(entry[0], last=False)
+
+        await asyncio.sleep(delay)
@@ -0,0 +1,25 @@
+from prisma import Prisma
+import asyncio
+
+from nutrisync_2.RollupSystem import RollupSystem
+from nutrisync_2.StatsSystem import StatsSystem
+
+async def rebuild_stats():
+    print("Rebuilding user statistics...")
+    db = Prisma()
+    await db.connect()
+
+    try:
+        async with db.tx() as tx:
+            rows = await StatsSystem.rebuild_all(tx)
+            days = await RollupSystem.rebuild_all(tx)
+        print(f"Rebuilt statistics for {rows} users and {days} daily rollups")
+
+    except Exception as e:
+        print(f"Error rebuilding statistics: {str(e)}")
+
+    finally:
+        await db.disconnect()
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_stats())
@@ -0,0 +1,91 @@
+from prisma import Prisma
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import pytz
+
+import bcrypt
+
+from nutrisync_2.DateUtils import to_epoch_ms
+from nutrisync_2.RollupSystem import RollupSystem
+from nutrisync_2.StatsSystem import StatsSystem
+from nutrisync_2.SyntheticData import COLUMNS, EXERCISE_CATALOG, SyntheticData
+
+# Stay under SQLite's default limit of 999 bound parameters per statement
+MAX_PARAMS = 999
+
+async def insert_rows(db, table, columns, rows, conflict=""):
+    """Multi-row INSERTs of as many rows as fit in one statement. Returns rows written."""
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    row_values = "(" + ", ".join(["?"] * len(columns)) + ")"
+    per_statement = MAX_PARAMS // len(columns)
+    written = 0
+    for start in range(0, len(rows), per_statement):
+        chunk = rows[start:start + per_statement]
+        params = [value for row in chunk for value in row]
+        written += await db.execute_raw(
+            f'INSERT {conflict} INTO "{table}" ({column_list}) VALUES {", ".join([row_values] * len(chunk))}',
+            *params,
+        )
+    return written
+
+async def seed_exercise_options(db):
+    # create_many(skip_duplicates=True) is not available on SQLite, so
+    # existing names are skipped with INSERT OR IGNORE; reruns are safe
+    now = to_epoch_ms(datetime.now(pytz.utc))
+    return await insert_rows(
+        db, "ExerciseOption", ("name", "category", "createdAt", "updatedAt"),
+        [(name, category, now, now) for name, category in EXERCISE_CATALOG],
+        conflict="OR IGNORE",
+    )
+
+async def seed_users(db, args):
+    user_row = await db.query_first('SELECT COALESCE(MAX("id"), 0) AS "id" FROM "User"')
+    workout_row = await db.query_first('SELECT COALESCE(MAX("id"), 0) AS "id" FROM "Workout"')
+
+    password = bcrypt.hashpw(args.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    data = SyntheticData(seed=args.seed, days=args.days, password=password)
+    tables = data.tables(
+        args.users, args.workouts_per_user, args.exercises_per_workout,
+        first_user_id=user_row['id'] + 1, first_workout_id=workout_row['id'] + 1,
+    )
+    for table, rows in tables.items():
+        count = await insert_rows(db, table, COLUMNS[table], rows)
+        print(f"Inserted {count} {table} rows")
+
+    # Derived tables are rebuilt rather than generated, so they match the raw rows exactly
+    await StatsSystem.rebuild_all(db)
+    await RollupSystem.rebuild_all(db)
+    print(f"Seeded users {user_row['id'] + 1}-{user_row['id'] + args.users}, all with password '{args.password}'")
+
+async def seed_database(args):
+    print("Seeding database...")
+    db = Prisma()
+    await db.connect()
+
+    try:
+        # One transaction: a failed run leaves the database as it was
+        async with db.tx(timeout=timedelta(minutes=30)) as tx:
+            count = await seed_exercise_options(tx)
+            print(f"Added {count} new exercise options")
+            if args.users:
+                await seed_users(tx, args)
+        print("Database seeding completed successfully!")
+
+    except Exception as e:
+        print(f"Error seeding database: {str(e)}")
+
+    finally:
+        await db.disconnect()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Add the exercise catalog and, optionally, synthetic users with a training history."
+    )
+    parser.add_argument("--users", type=int, default=0, help="synthetic users to add (default: exercise catalog only)")
+    parser.add_argument("--workouts-per-user", type=int, default=100)
+    parser.add_argument("--exercises-per-workout", type=int, default=3)
+    parser.add_argument("--days", type=int, default=730, help="how far back workout history goes")
+    parser.add_argument("--seed", type=int, default=42, help="random seed; the same seed gives the same data")
+    parser.add_argument("--password", default="password", help="login password for every synthetic user")
+    asyncio.run(seed_database(parser.parse_args()))